@@ -0,0 +1,49 @@
+import discord
+from discord.ext import commands
+
+from Functions.general import ensure_perms
+from Functions.cache import GRAPH_CACHE, GRAPH_FLIGHTS
+
+class cache(commands.Cog):
+	"""
+	Shows the counters of the graph cache and render coalescing, or clears the cache
+
+	Staff only, for checking how well the cache is doing
+	"""
+
+	FORMAT = "(clear)"
+
+	USAGE = ""
+
+
+	def __init__(self, BOT):
+		self.BOT = BOT
+
+
+	@commands.command(name="cache", hidden=True)
+	@ensure_perms()
+	async def output(self, ctx):
+		message = ctx.message
+		args = ctx.message.content.split(" ")
+		level = len(args)
+		server = ctx.guild
+
+		await self.run_command(message, args, level, server)
+		return
+
+
+	async def run_command(self, message, args, level, server):
+		if level > 1 and args[1].lower() == "clear":
+			GRAPH_CACHE.clear()
+
+			await message.channel.send("Graph cache cleared.")
+			return
+
+		await message.channel.send(
+		f"**Graph cache**\n```{GRAPH_CACHE.stats()}```"
+		+ f"**Graph renders**\n```{GRAPH_FLIGHTS.stats()}```")
+		return
+
+
+def setup(BOT):
+	BOT.add_cog(cache(BOT))
\ No newline at end of file
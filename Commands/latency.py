@@ -0,0 +1,46 @@
+import discord
+from discord.ext import commands
+
+from Functions.general import ensure_perms
+from Functions.metrics import METRICS
+
+class latency(commands.Cog):
+	"""
+	Shows the p50/p95/p99 run time of every command since the bot started
+
+	Staff only. Times are in milliseconds, and are also split into time
+	spent on data, rendering and Discord API calls
+	"""
+
+	FORMAT = ""
+
+	USAGE = ""
+
+
+	def __init__(self, BOT):
+		self.BOT = BOT
+
+
+	@commands.command(name="latency", hidden=True)
+	@ensure_perms()
+	async def output(self, ctx):
+		message = ctx.message
+		args = ctx.message.content.split(" ")
+		level = len(args)
+		server = ctx.guild
+
+		await self.run_command(message, args, level, server)
+		return
+
+
+	async def run_command(self, message, args, level, server):
+		if len(METRICS.HISTOGRAMS) == 0:
+			await message.channel.send("No commands have been timed yet.")
+			return
+
+		await message.channel.send(f"**Command latency (ms)**\n```{METRICS.table()}```")
+		return
+
+
+def setup(BOT):
+	BOT.add_cog(latency(BOT))
@@ -0,0 +1,77 @@
+import discord
+from discord.ext import commands
+
+from Functions.general import ensure_perms, is_int
+from Functions.metrics import METRICS
+from Functions.output import OUTPUT
+
+class profilenext(commands.Cog):
+	"""
+	Profiles the next few runs of a command, replying with the report
+
+	Staff only, for finding out which calls make a command slow. Nothing
+	is profiled unless asked for
+	"""
+
+	FORMAT = "[command] (runs)"
+
+	USAGE = ""
+
+	MAX_RUNS = 50
+
+
+	def __init__(self, BOT):
+		self.BOT = BOT
+
+
+	@commands.command(name="profile-next", aliases=['profilenext'], hidden=True)
+	@ensure_perms()
+	async def output(self, ctx):
+		message = ctx.message
+		args = ctx.message.content.split(" ")
+		level = len(args)
+		server = ctx.guild
+
+		await self.run_command(message, args, level, server)
+		return
+
+
+	async def run_command(self, message, args, level, server):
+		if level < 2:
+			await message.channel.send("Include the command to profile!")
+			return
+
+		# Commands can be given by name or alias, with or without the prefix
+		name = args[1].lower()
+		if name.startswith("gl/"):
+			name = name[3:]
+
+		if (command := self.BOT.get_command(name)) is None:
+			await message.channel.send(f"The command **`{name}`** does not exist!")
+			return
+
+		cog = command.cog.qualified_name
+
+		runs = 1
+		if level > 2:
+			if not is_int(args[2]) or not 1 <= int(args[2]) <= self.MAX_RUNS:
+				await message.channel.send(
+				f"The number of runs has to be between 1 and {self.MAX_RUNS}!")
+				return
+
+			runs = int(args[2])
+
+		async def send_report(report):
+			await message.channel.send(
+			f"Profile of the last {runs} run(s) of **`gl/{cog}`**:",
+			file=OUTPUT.file(report, f"profile_{cog}.txt"))
+
+		METRICS.profile_next(cog, runs, send_report)
+
+		await message.channel.send(
+		f"Profiling the next {runs} run(s) of **`gl/{cog}`**.")
+		return
+
+
+def setup(BOT):
+	BOT.add_cog(profilenext(BOT))
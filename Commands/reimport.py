@@ -41,6 +41,13 @@ class reimport(commands.Cog):
 		
 		file_name = args[1].lower()
 
+		# Rebuild the round catalog and name index after the Data folder changes
+		if file_name == "data":
+			await self.BOT.loop.run_in_executor(None, DATA.rebuild, "CATALOG", "NAMES")
+
+			await message.channel.send("Data catalog rebuilt successfully.")
+			return
+
 		if len(message.attachments) != 0:
 			await message.attachments[0].save(f"Commands/{file_name}.py")
 
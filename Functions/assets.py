@@ -0,0 +1,115 @@
+from PIL import Image, ImageFont
+import functools
+import time
+import os
+
+class ASSETS():
+	"""
+	Cache for the fonts and base images used to draw graphs
+
+	Every font size and image is only loaded from disk once. Images are
+	handed out as copies, so callers are free to draw on them
+	"""
+
+	FOLDER = 'Images'			# Where the base images are
+	FONT_FOLDER = 'Images/Fonts'	# Where the fonts are
+
+	# Fonts and sizes the graph commands use, loaded by preload()
+	PRELOAD_FONTS = {
+		"Assistant-Bold": [10, 15, 18, 22, 25, 29, 30, 35, 45]
+	}
+
+	@classmethod
+	@functools.lru_cache(maxsize=None)
+	def font(cls, name, size):
+		"""Returns a font from the font folder (e.g. "Assistant-Bold") in a given size"""
+
+		return ImageFont.truetype(f'{cls.FONT_FOLDER}/{name}.ttf', size)
+
+
+	@classmethod
+	@functools.lru_cache(maxsize=None)
+	def base_image(cls, name):
+		"""Returns the cached, fully decoded copy of an image. Not to be drawn on"""
+
+		image = Image.open(f'{cls.FOLDER}/{name}')
+		image.load()
+
+		return image
+
+
+	@classmethod
+	def image(cls, name, copy=True):
+		"""Returns an image from the image folder (e.g. "graph_base.png")
+
+		It's a fresh copy unless copy is False, which is only safe for images
+		that are just read, like masks"""
+
+		image = cls.base_image(name)
+
+		return image.copy() if copy else image
+
+
+	@classmethod
+	def preload(cls):
+		"""Loads every base image and the font sizes in PRELOAD_FONTS"""
+
+		for name in os.listdir(cls.FOLDER):
+			if name.endswith('.png'):
+				cls.base_image(name)
+
+		for name, sizes in cls.PRELOAD_FONTS.items():
+			for size in sizes:
+				cls.font(name, size)
+
+		print(f"Preloaded {cls.base_image.cache_info().currsize} images "
+			+ f"and {cls.font.cache_info().currsize} fonts")
+
+
+def benchmark(loads=200):
+	"""Times loading fonts and images from disk against the ASSETS cache"""
+
+	images = [name for name in os.listdir(ASSETS.FOLDER) if name.endswith('.png')]
+	sizes = [size for sizes in ASSETS.PRELOAD_FONTS.values() for size in sizes]
+
+	def uncached_font(ind):
+		return ImageFont.truetype(f'{ASSETS.FONT_FOLDER}/Assistant-Bold.ttf', sizes[ind % len(sizes)])
+
+	def cached_font(ind):
+		return ASSETS.font("Assistant-Bold", sizes[ind % len(sizes)])
+
+	def uncached_image(ind):
+		image = Image.open(f'{ASSETS.FOLDER}/{images[ind % len(images)]}')
+		image.load()
+		return image
+
+	def cached_image(ind):
+		return ASSETS.image(images[ind % len(images)])
+
+	start = time.perf_counter()
+	ASSETS.preload()
+	preload_time = time.perf_counter() - start
+
+	print(f"Preload:         {1000 * preload_time:.2f} ms")
+
+	for label, uncached, cached in [
+		["Font", uncached_font, cached_font],
+		["Image", uncached_image, cached_image]]:
+
+		timings = []
+
+		for loader in [uncached, cached]:
+			start = time.perf_counter()
+
+			for ind in range(loads):
+				loader(ind)
+
+			timings.append(1e6 * (time.perf_counter() - start) / loads)
+
+		print(f"{label:<5} from disk: {timings[0]:.2f} µs per load")
+		print(f"{label:<5} cached:    {timings[1]:.2f} µs per load")
+
+
+if __name__ == "__main__":
+	# Benchmark entry point: python -m Functions.assets
+	benchmark()
\ No newline at end of file
@@ -0,0 +1,294 @@
+from collections import OrderedDict
+import hashlib
+import asyncio
+import json
+import os
+
+class RenderCache():
+	"""
+	LRU cache of rendered images, keyed by a hash of everything that went into them
+
+	Entries are [bytes, file extension] pairs. The memory cache is bounded in
+	bytes, and if a folder is given every entry is also written there, so
+	renders survive restarts. The folder is bounded in bytes too, dropping
+	its oldest files first. If the folder can't be used (e.g. on a read-only
+	filesystem), the cache carries on in memory only
+	"""
+
+	def __init__(self, max_bytes=64 * 2**20, folder=None, max_disk_bytes=256 * 2**20):
+		self.max_bytes = max_bytes				# Memory budget
+		self.folder = folder					# Where entries persist, or None
+		self.max_disk_bytes = max_disk_bytes	# Disk budget
+
+		# Key -> [bytes, extension], least recently used first
+		self.entries = OrderedDict()
+		self.size = 0
+
+		# Key -> [file name, bytes] of the files in the folder, oldest first.
+		# Indexed the first time the disk is needed
+		self.files = None
+		self.disk_size = 0
+
+		self.hits = 0
+		self.misses = 0
+
+
+	def __len__(self):
+		return len(self.entries)
+
+
+	@staticmethod
+	def key(*parts):
+		"""Hashes the normalized parts of a request into a cache key
+
+		Parts have to be JSON types, e.g. ints rather than numpy ints"""
+
+		return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()[:32]
+
+
+	def get(self, key):
+		"""Returns the cached [bytes, extension] of a key, or None on a miss"""
+
+		if key in self.entries:
+			self.entries.move_to_end(key)
+			self.hits += 1
+
+			return self.entries[key]
+
+		entry = self.read(key)
+
+		if entry is None:
+			self.misses += 1
+			return None
+
+		self.hits += 1
+		self.remember(key, entry)
+
+		return entry
+
+
+	def put(self, key, data, extension):
+		"""Caches an image in memory, and on disk if there's a folder"""
+
+		self.remember(key, [data, extension])
+		self.write(key, data, extension)
+
+
+	def remember(self, key, entry):
+		"""Adds an entry to the memory cache, evicting the least recently used ones"""
+
+		# Too big to ever fit
+		if len(entry[0]) > self.max_bytes:
+			return
+
+		if key in self.entries:
+			self.size -= len(self.entries.pop(key)[0])
+
+		self.entries[key] = entry
+		self.size += len(entry[0])
+
+		while self.size > self.max_bytes:
+			self.size -= len(self.entries.popitem(last=False)[1][0])
+
+
+	def index(self):
+		"""Lists the folder's files, dropping the oldest ones over the disk budget"""
+
+		if self.files is not None:
+			return self.files
+
+		self.files = OrderedDict()
+
+		if self.folder is None:
+			return self.files
+
+		found = []
+
+		try:
+			os.makedirs(self.folder, exist_ok=True)
+
+			for file_name in os.listdir(self.folder):
+				# Left over from a write that was interrupted
+				if file_name.endswith('.tmp'):
+					os.remove(f'{self.folder}/{file_name}')
+					continue
+
+				stat = os.stat(f'{self.folder}/{file_name}')
+				found.append([stat.st_mtime, file_name, stat.st_size])
+
+		except OSError as error:
+			self.disable(error)
+			return self.files
+
+		for _, file_name, size in sorted(found):
+			self.files[file_name.split('.')[0]] = [file_name, size]
+			self.disk_size += size
+
+		self.prune()
+
+		return self.files
+
+
+	def prune(self):
+		"""Deletes the oldest files until the folder fits the disk budget"""
+
+		while self.disk_size > self.max_disk_bytes and len(self.files) != 0:
+			file_name, size = self.files.popitem(last=False)[1]
+			self.disk_size -= size
+
+			try:
+				os.remove(f'{self.folder}/{file_name}')
+			except FileNotFoundError:
+				pass
+			except OSError as error:
+				self.disable(error)
+				return
+
+
+	def read(self, key):
+		"""Loads an entry from the folder, or returns None if it isn't there"""
+
+		if key not in self.index():
+			return None
+
+		file_name = self.files[key][0]
+
+		try:
+			with open(f'{self.folder}/{file_name}', 'rb') as f:
+				data = f.read()
+
+		except FileNotFoundError:
+			self.disk_size -= self.files.pop(key)[1]
+			return None
+
+		except OSError as error:
+			self.disable(error)
+			return None
+
+		return [data, file_name.split('.', 1)[1]]
+
+
+	def write(self, key, data, extension):
+		"""Saves an entry to the folder, if there is one"""
+
+		# Indexing first, since it stops using the folder if it can't be read
+		if key in self.index() or self.folder is None:
+			return
+
+		file_name = f'{key}.{extension}'
+
+		# Written under a temporary name first, so a half-written file is never read
+		try:
+			with open(f'{self.folder}/{file_name}.tmp', 'wb') as f:
+				f.write(data)
+
+			os.replace(f'{self.folder}/{file_name}.tmp', f'{self.folder}/{file_name}')
+
+		except OSError as error:
+			self.disable(error)
+			return
+
+		self.files[key] = [file_name, len(data)]
+		self.disk_size += len(data)
+
+		self.prune()
+
+
+	def disable(self, error):
+		"""Stops using the folder after an error, keeping the memory cache"""
+
+		print(f"Cache folder {self.folder} can't be used, caching in memory only: {error}")
+
+		self.folder = None
+		self.files = OrderedDict()
+		self.disk_size = 0
+
+
+	def clear(self):
+		"""Empties the cache, deleting its files too, and resets the counters"""
+
+		self.entries.clear()
+		self.size = 0
+
+		for file_name, _ in self.index().values():
+			try:
+				os.remove(f'{self.folder}/{file_name}')
+			except FileNotFoundError:
+				pass
+			except OSError as error:
+				self.disable(error)
+				break
+
+		self.files.clear()
+		self.disk_size = 0
+
+		self.hits = 0
+		self.misses = 0
+
+
+	def stats(self):
+		"""Returns a short summary of the counters and sizes"""
+
+		lookups = self.hits + self.misses
+		hit_rate = 100 * self.hits / lookups if lookups != 0 else 0
+
+		return (f"{self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate)\n"
+			+ f"{len(self)} images in memory ({self.size / 2**20:.1f} MB)\n"
+			+ f"{len(self.index())} images on disk ({self.disk_size / 2**20:.1f} MB)")
+
+
+class SingleFlight():
+	"""
+	Coalesces concurrent identical computations into one
+
+	The first caller for a key starts the computation, and anyone asking
+	for the same key while it's in flight awaits that same result (or
+	exception) instead of starting their own
+	"""
+
+	def __init__(self):
+		self.flights = {}	# Key -> future of the computation in flight
+
+		self.started = 0	# Computations actually run
+		self.joined = 0		# Calls that shared one already in flight
+
+
+	def __len__(self):
+		return len(self.flights)
+
+
+	async def run(self, key, function, *args):
+		"""Returns await function(*args), sharing it with concurrent calls for key"""
+
+		if key in self.flights:
+			self.joined += 1
+
+		else:
+			self.started += 1
+
+			future = asyncio.ensure_future(function(*args))
+			future.add_done_callback(lambda future, key=key: self.flights.pop(key, None))
+
+			self.flights[key] = future
+
+		# Shielded so that one caller giving up doesn't cancel it for the others
+		return await asyncio.shield(self.flights[key])
+
+
+	def stats(self):
+		"""Returns a short summary of the counters"""
+
+		return (f"{self.started} computed, {self.joined} deduplicated, "
+			+ f"{len(self)} in flight")
+
+
+# Cache of gl/graph images. Sizes are in MB, and images are only kept on
+# disk if a folder is set
+GRAPH_CACHE = RenderCache(
+	max_bytes=int(os.getenv("GLICKO_CACHE_MB", "64")) * 2**20,
+	folder=os.getenv("GLICKO_CACHE_FOLDER") or None,
+	max_disk_bytes=int(os.getenv("GLICKO_CACHE_DISK_MB", "256")) * 2**20
+)
+
+# gl/graph renders in flight, keyed like GRAPH_CACHE
+GRAPH_FLIGHTS = SingleFlight()
@@ -1,87 +1,189 @@
-import numpy as np
-
-class CALC():
-	"""
-	Class with several functions and variables for Glicko-related calculations
-	"""
-
-	Q = np.log(10) / 400	# General calibration constant
-	C = 30.6186218			# RD decay constant (250 RD -> 875 RD in 2.5 years)
-
-	@classmethod
-	def performance(cls, NR, strength, round_G):
-		"""Calculates the RM level performance of an NR in a certain round strength
-
-		Mathematically, this is also the inverse of the E formula in terms of RM0"""
-
-		p = (round_G * strength * np.log(10) - 400 * np.log(1 / NR - 1))
-		p /= (round_G * np.log(10))
-
-		return p
-
-
-	@classmethod
-	def win_chance(cls, player1, player2, convert=False):
-		"""Calculates player 1's win chance in a match against player 2
-		
-		Adapted from the E formula"""
-
-		convert = 5 if convert else 1
-
-		RM_1, RD_1 = [value / convert for value in player1[1:3]]
-		RM_2, RD_2 = [value / convert for value in player2[1:3]]
-
-		combined_RD = np.sqrt(RD_1 ** 2 + RD_2 ** 2)
-		chance_1 = 1 / (1 + 10 ** (- cls.G(combined_RD) * (RM_1 - RM_2) / 400))
-
-		return chance_1
-
-
-	@classmethod
-	def E(cls, RM_1, RM_2, RD_2, convert=False):
-		"""Player 1's expected score against player 2"""
-
-		convert = 5 if convert else 1
-
-		RM_1 /= convert
-		RM_2 /= convert
-		RD_2 /= convert
-
-		expected = 1 / (1 + 10 ** (- cls.G(RD_2) * (RM_1 - RM_2) / 400))
-
-		return expected
-
-
-	@classmethod
-	def G(cls, RD):
-		"""Calculates the matchup certainty weight for a given RD"""
-
-		result = np.sqrt(1 / (1 + 3 * cls.Q**2 * RD**2 / np.pi**2))
-
-		return result
-	
-
-	@classmethod
-	def decay_RD(cls, RD, days=1):
-		"""Decays an RD value by a given number of days"""
-
-		for _ in range(days):
-			if RD < 50:
-				RD = (29 * RD + 50) / 30
-			
-			RD = np.sqrt(RD**2 + cls.C**2/30)
-			RD = min(175, RD)
-		
-		return RD
-	
-
-	@classmethod
-	def round_weight(cls, cont_count):
-		"""Returns the matchup weight for a round of a given size"""
-
-		if cont_count < 5:
-			w_i = cont_count - 1
-		else:
-			w_i = 0.0547 * cont_count + 4 * np.sqrt(cont_count) - 5.7663
-
-		return w_i
\ No newline at end of file
+import numpy as np
+
+class CALC():
+	"""
+	Class with several functions and variables for Glicko-related calculations
+	"""
+
+	Q = np.log(10) / 400	# General calibration constant
+	C = 30.6186218			# RD decay constant (250 RD -> 875 RD in 2.5 years)
+
+	CHUNK_SIZE = 2**22		# Max win chances computed at once (32 MB of float64)
+
+	@classmethod
+	def performance(cls, NR, strength, round_G):
+		"""Calculates the RM level performance of an NR in a certain round strength
+
+		Mathematically, this is also the inverse of the E formula in terms of RM0"""
+
+		p = (round_G * strength * np.log(10) - 400 * np.log(1 / NR - 1))
+		p /= (round_G * np.log(10))
+
+		return p
+
+
+	@classmethod
+	def win_chance(cls, player1, player2, convert=False):
+		"""Calculates player 1's win chance in a match against player 2
+		
+		Adapted from the E formula"""
+
+		convert = 5 if convert else 1
+
+		_, RM_1, RD_1 = player1[:3]
+		_, RM_2, RD_2 = player2[:3]
+
+		return cls.win_chances(RM_1 / convert, RD_1 / convert, RM_2 / convert, RD_2 / convert)
+
+
+	@classmethod
+	def win_chances(cls, RM_1, RD_1, RM_2, RD_2):
+		"""Calculates players 1's win chances against players 2
+
+		Works element by element on numbers or NumPy arrays, which are
+		broadcast together"""
+
+		combined_RD = np.sqrt(RD_1 ** 2 + RD_2 ** 2)
+		chance_1 = 1 / (1 + 10 ** (- cls.G(combined_RD) * (RM_1 - RM_2) / 400))
+
+		return chance_1
+
+
+	@classmethod
+	def win_chance_blocks(cls, RM_1, RD_1, RM_2=None, RD_2=None, convert=False):
+		"""Yields the matrix of every player 1's win chance against every player 2
+		in blocks of rows, as (first row, block)
+
+		Blocks hold at most CHUNK_SIZE chances, so memory stays bounded for any
+		amount of players. Players 2 default to players 1"""
+
+		convert = 5 if convert else 1
+
+		RM_1 = np.asarray(RM_1, dtype=np.float64) / convert
+		RD_1 = np.asarray(RD_1, dtype=np.float64) / convert
+
+		RM_2 = RM_1 if RM_2 is None else np.asarray(RM_2, dtype=np.float64) / convert
+		RD_2 = RD_1 if RD_2 is None else np.asarray(RD_2, dtype=np.float64) / convert
+
+		rows = max(1, cls.CHUNK_SIZE // max(1, len(RM_2)))
+
+		for start in range(0, len(RM_1), rows):
+			end = start + rows
+
+			yield start, cls.win_chances(
+				RM_1[start:end, np.newaxis], RD_1[start:end, np.newaxis],
+				RM_2[np.newaxis, :], RD_2[np.newaxis, :]
+			)
+
+
+	@classmethod
+	def win_chance_matrix(cls, RM_1, RD_1, RM_2=None, RD_2=None, convert=False):
+		"""Returns the full matrix of every player 1's win chance against every
+		player 2, with players 1 as rows. Players 2 default to players 1"""
+
+		columns = len(RM_1) if RM_2 is None else len(RM_2)
+		matrix = np.zeros((len(RM_1), columns))
+
+		for start, block in cls.win_chance_blocks(RM_1, RD_1, RM_2, RD_2, convert):
+			matrix[start:start + len(block)] = block
+		
+		return matrix
+
+
+	@classmethod
+	def expected_ranks(cls, RM, RD, convert=False):
+		"""Calculates each player's expected rank in a round with all the others
+
+		That is 1 + the sum of everyone else's win chances against them"""
+
+		expected_wins = np.zeros(len(RM))
+
+		for start, block in cls.win_chance_blocks(RM, RD, convert=convert):
+			expected_wins[start:start + len(block)] = block.sum(axis=1)
+		
+		# Every player is also matched against themselves, at a 50% chance
+		expected_wins -= 0.5
+
+		return len(RM) - expected_wins
+
+
+	@classmethod
+	def E(cls, RM_1, RM_2, RD_2, convert=False):
+		"""Player 1's expected score against player 2"""
+
+		convert = 5 if convert else 1
+
+		# Not in-place, so that arrays passed in aren't modified
+		RM_1 = RM_1 / convert
+		RM_2 = RM_2 / convert
+		RD_2 = RD_2 / convert
+
+		expected = 1 / (1 + 10 ** (- cls.G(RD_2) * (RM_1 - RM_2) / 400))
+
+		return expected
+
+
+	@classmethod
+	def G(cls, RD):
+		"""Calculates the matchup certainty weight for a given RD"""
+
+		result = np.sqrt(1 / (1 + 3 * cls.Q**2 * RD**2 / np.pi**2))
+
+		return result
+	
+
+	@classmethod
+	def decay_RD(cls, RD, days=1):
+		"""Decays RD values by a given number of days
+
+		RD and days can be numbers or NumPy arrays, which are broadcast together"""
+
+		RD, days = np.broadcast_arrays(np.asarray(RD, dtype=np.float64), np.asarray(days))
+
+		RD = RD.copy()
+		days = np.array(np.maximum(days, 0), dtype=np.int64)
+
+		# Below 50, RD is also pulled up towards 50 every day, so those values
+		# are stepped one day at a time. They always pass 50 within 45 days.
+		# The steps only depend on the starting RD, so each distinct one is
+		# stepped once, keeping every step, and each value takes the step its
+		# day count lands on (values repeat a lot, e.g. a player's RD decayed
+		# over every day since their last round)
+		flat_RD, flat_days = RD.reshape(-1), days.reshape(-1)	# Views of RD and days
+		low = np.flatnonzero((flat_RD < 50) & (flat_days > 0))
+
+		if len(low) != 0:
+			starts, inverse = np.unique(flat_RD[low], return_inverse=True)
+			steps = [starts]
+
+			while (steps[-1] < 50).any() and len(steps) <= flat_days[low].max():
+				previous = steps[-1]
+
+				steps.append(np.where(previous < 50,
+					np.sqrt(((29 * previous + 50) / 30)**2 + cls.C**2/30), previous))
+			
+			steps = np.array(steps)
+
+			# Steps taken: until RD passes 50, or the days run out
+			taken = np.minimum(flat_days[low], (steps < 50).sum(axis=0)[inverse])
+
+			flat_RD[low] = steps[taken, inverse]
+			flat_days[low] -= taken
+		
+		# Above 50, RD² grows by C²/30 a day until RD is capped at 175
+		decayed = np.minimum(175, np.sqrt(RD**2 + days * cls.C**2/30))
+		RD = np.where(days > 0, decayed, RD)
+
+		return RD[()]
+	
+
+	@classmethod
+	def round_weight(cls, cont_count):
+		"""Returns the matchup weight for a round of a given size"""
+
+		if cont_count < 5:
+			w_i = cont_count - 1
+		else:
+			w_i = 0.0547 * cont_count + 4 * np.sqrt(cont_count) - 5.7663
+
+		return w_i
@@ -0,0 +1,118 @@
+try:
+	from Functions.dates import DATES
+except ModuleNotFoundError:
+	from dates import DATES
+
+import numpy as np
+import bisect
+import os
+
+class RoundCatalog():
+	"""
+	In-memory table of every season and round in the Data folder
+
+	Built once by reading the season index and every round file. Only rounds
+	that are counted for TWOW Glicko (present in ROUNDS) are included
+	"""
+
+	def __init__(self, ROUNDS, season_folder, folder='Data'):
+		with open(f'{folder}/index.txt', 'r', encoding='utf-8') as f:
+			season_list = f.read().splitlines()
+
+		folder_list = os.listdir(folder)
+
+		# Seasons that are both in the season index and have a folder
+		self.seasons = [
+			season_name
+			for season_name in season_list
+			if season_folder(season_name) in folder_list
+		]
+
+		# Lowercase season name -> season name (the first, if several share it)
+		self.lower_seasons = {}
+		for season_name in self.seasons:
+			self.lower_seasons.setdefault(season_name.lower(), season_name)
+
+		# Season -> {round number -> [number, date, size, strength, contestants]}
+		self.rounds = {}
+
+		for season_name in dict.fromkeys(self.seasons):
+			season_rounds = {}
+			round_folder = f'{folder}/{season_folder(season_name)}'
+
+			for round_file in os.listdir(round_folder):
+				with open(f'{round_folder}/{round_file}', 'r', encoding='utf-8') as f:
+					round_info = f.read().splitlines()
+
+				round_number = round_file[:-4]
+				full_round_name = f"{season_name} R{round_number}"
+
+				round_date = int(round_info[0])
+				lookup_ind = DATES.month_diff(round_date, DATES.MIN_DATE)
+
+				# If the round isn't actually counted for TWOW Glicko
+				if full_round_name not in ROUNDS[lookup_ind].keys():
+					continue
+
+				strength = ROUNDS[lookup_ind][full_round_name][0]
+				contestants = [name.strip() for name in round_info[1:]]
+
+				season_rounds[round_number] = [
+					round_number,
+					round_date,
+					len(contestants),
+					strength,
+					contestants
+				]
+
+			self.rounds[season_name] = season_rounds
+
+		# Every round as [full name, date, size, strength], sorted by date
+		self.by_date = sorted([
+			[f"{season_name} R{number}", date, size, strength]
+			for season_name, season_rounds in self.rounds.items()
+			for number, date, size, strength, _ in season_rounds.values()
+		], key=lambda m: m[1])
+
+		self.dates = [r[1] for r in self.by_date]
+
+
+	def __len__(self):
+		return len(self.by_date)
+
+
+	def season_rounds(self, season):
+		"""Outputs [number, date, size, strength] for each round of a season"""
+
+		return [r[:4] for r in self.rounds[season].values()]
+
+
+	def season_info(self, season):
+		"""Outputs a list of overall statistics of a season"""
+
+		raw_info = self.season_rounds(season)
+
+		info = [
+			season,										# 0 -> Season name
+			len(raw_info),								# 1 -> Amount of rounds
+			min([round[1] for round in raw_info]),		# 2 -> Starting date
+			max([round[1] for round in raw_info]),		# 3 -> Latest round date
+			np.mean([round[3] for round in raw_info])	# 4 -> Average round strength
+		]
+
+		return info
+
+
+	def round_entry(self, season, round_n):
+		"""Returns [number, date, size, strength, contestants] of a round, or False"""
+
+		return self.rounds[season].get(str(round_n), False)
+
+
+	def rounds_between(self, start, end):
+		"""Outputs [full name, date, size, strength] for rounds between two date IDs"""
+
+		first = bisect.bisect_left(self.dates, start)
+		last = bisect.bisect_right(self.dates, end)
+
+		return [list(r) for r in self.by_date[first:last]]
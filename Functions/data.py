@@ -1,15 +1,98 @@
 try:
 	from Functions.dates import DATES
+	from Functions.snapshot import SNAPSHOT
+	from Functions.names import NameIndex
+	from Functions.catalog import RoundCatalog
+	from Functions.tables import StringTable, MonthTable
+	from Functions.metrics import METRICS
 except ModuleNotFoundError:
 	from dates import DATES
+	from snapshot import SNAPSHOT
+	from names import NameIndex
+	from catalog import RoundCatalog
+	from tables import StringTable, MonthTable
+	from metrics import METRICS
 
 import numpy as np
+import functools
+import asyncio
+import threading
 import json
-import os
+import time
+
+class LazyDataset():
+	"""
+	Class-level descriptor for a dataset that's only loaded on first access
+
+	The loader is called with the owner class. Loading is guarded by a lock,
+	so concurrent first accesses from several threads only load it once
+	"""
+
+	def __init__(self, loader, log=True):
+		self.loader = loader
+		self.log = log
+
+		self.lock = threading.Lock()
+		self.loaded = False
+		self.value = None
+	
+
+	def __set_name__(self, owner, name):
+		self.name = name
+	
+
+	def __get__(self, instance, owner):
+		if self.loaded:
+			return self.value
+		
+		with self.lock:
+			# Another thread may have finished loading it while this one waited
+			if not self.loaded:
+				start = time.perf_counter()
+
+				self.value = self.loader(owner)
+				self.loaded = True
+
+				if self.log:
+					elapsed = time.perf_counter() - start
+					print(f"Loaded {self.name} in {elapsed:.2f}s ({self.describe(self.value)})")
+		
+		return self.value
+	
+
+	def rebuild(self, owner):
+		"""Loads the dataset again and swaps it in with a single assignment"""
+
+		start = time.perf_counter()
+		value = self.loader(owner)
+
+		with self.lock:
+			self.value = value
+			self.loaded = True
+
+		if self.log:
+			elapsed = time.perf_counter() - start
+			print(f"Rebuilt {self.name} in {elapsed:.2f}s ({self.describe(value)})")
+	
+
+	@staticmethod
+	def describe(value):
+		"""Short description of a dataset's size for the load log"""
+
+		if isinstance(value, dict):
+			arrays = [v for v in value.values() if isinstance(v, np.ndarray)]
+
+			if len(arrays) != 0:
+				return f"{sum([a.nbytes for a in arrays]) / 2**20:.1f} MB of arrays"
+		
+		return f"{len(value)} entries"
+
 
 class DATA():
 	"""
 	Wrapper class for handling the TWOW Glicko data
+
+	Every dataset is loaded lazily the first time it's accessed
 	"""
 
 	RD_CUTOFF = 500		# Sheet RD cutoff
@@ -17,83 +100,395 @@ class DATA():
 	DEFAULT_PLAYER = [550, 900, 175, 0]			# Stat values for the default player
 	DEFAULT_PLAYER_C = [2750, 4500, 875, 0]		# Default values converted to sheet scale
 
-	with open(f'JSON Data/resultdaily.json', encoding='utf-8') as f:
-		RESULTDAILY = json.load(f)
-		print("Loaded RESULTDAILY.JSON")
-	
-	with open(f'JSON Data/history.json', encoding='utf-8') as f:
-		HISTORY = json.load(f)
-		print("Loaded HISTORY.JSON")
-	
-	with open(f'JSON Data/ranks.json', encoding='utf-8') as f:
-		RANKS = json.load(f)
-		print("Loaded RANKS.JSON")
-	
-	with open(f'JSON Data/rounds.json', encoding='utf-8') as f:
-		ROUNDS = json.load(f)
-		print("Loaded ROUNDS.JSON")
+	USE_SNAPSHOT = True		# Whether a compiled snapshot is used when it's up to date
+
+	STATS = ["score", "RM", "RD", "RP", "rank"]	# Stat order used by the columnar store
+
+	# Compiled snapshot arrays (None if there's no up-to-date snapshot)
+	SNAPSHOT_DATA = LazyDataset(lambda cls: (
+		SNAPSHOT.load() if cls.USE_SNAPSHOT and SNAPSHOT.is_current() else None
+	), log=False)
+
+	# Stamp of the data files in use, for caches of anything derived from them
+	VERSION = LazyDataset(lambda cls: f"{DATES.MAX_DATE}-{SNAPSHOT.fingerprint()}", log=False)
+
+	# Raw datasets. RESULTDAILY and RANKS only need to be read from the JSON
+	# files when there's no snapshot to build the columnar store from
+	RESULTDAILY = LazyDataset(lambda cls: cls.read_json("resultdaily"))
+	RANKS = LazyDataset(lambda cls: cls.read_json("ranks"))
+
+	# Record layouts of the dictionary-encoded datasets. Players and rounds
+	# are IDs in the STRINGS table, and records are sorted by month
+	HISTORY_RECORD = np.dtype([
+		('month', np.int16), ('player', np.int32), ('round', np.int32),
+		('gain', np.float64), ('rank', np.int32), ('size', np.int32)
+	])
+	ROUNDS_RECORD = np.dtype([
+		('month', np.int16), ('round', np.int32),
+		('strength', np.float64), ('date', np.int32)
+	])
+	TOTM_RECORD = np.dtype([
+		('month', np.int16), ('player', np.int32), ('rating', np.float64)
+	])
+
+	# Encoded HISTORY, ROUNDS and TOTM records, along with the string table
+	RECORDS = LazyDataset(lambda cls: (
+		cls.encode_records() if cls.SNAPSHOT_DATA is None else {
+			key: cls.SNAPSHOT_DATA[key] for key in SNAPSHOT.RECORD_KEYS
+		}
+	))
+
+	STRINGS = LazyDataset(lambda cls: StringTable(cls.RECORDS["strings"]), log=False)
+
+	# Month-indexed views that decode the records back into the JSON layout
+	HISTORY = LazyDataset(lambda cls: MonthTable(
+		cls.RECORDS["history"], cls.RECORDS["history_months"], cls.decode_history
+	), log=False)
+	ROUNDS = LazyDataset(lambda cls: MonthTable(
+		cls.RECORDS["rounds"], cls.RECORDS["rounds_months"], cls.decode_rounds
+	), log=False)
+	TOTM = LazyDataset(lambda cls: MonthTable(
+		cls.RECORDS["totm"], cls.RECORDS["totm_months"], cls.decode_totm
+	), log=False)
+
+	# Columnar store and its parts
+	STORE = LazyDataset(lambda cls: (
+		cls.build_store() if cls.SNAPSHOT_DATA is None else SNAPSHOT.store(cls.SNAPSHOT_DATA)
+	))
+
+	PLAYERS = LazyDataset(lambda cls: cls.STORE["players"], log=False)	# Player names, in row order
+	PLAYER_ROWS = LazyDataset(lambda cls: {		# Player name -> row index
+		player: row for row, player in enumerate(cls.PLAYERS)
+	}, log=False)
+
+	START_DAYS = LazyDataset(lambda cls: cls.STORE["start"], log=False)		# Row -> day of first entry
+	RANK_DAYS = LazyDataset(lambda cls: cls.STORE["rank_days"], log=False)	# Row -> days with a rank
+	TABLES = LazyDataset(lambda cls: [		# players x days matrices, in STATS order (sheet scale)
+		cls.STORE[stat] for stat in SNAPSHOT.STORE_ARRAYS[:5]
+	], log=False)
+
+	# Record layout of a player's rounds in the PLAYER_ROUNDS index
+	ROUND_RECORD = np.dtype([
+		('round', np.int32), ('month', np.int16), ('date', np.int32),
+		('gain', np.float64), ('rank', np.int32), ('size', np.int32),
+		('strength', np.float64), ('NR', np.float64)
+	])
+
+	# Record layout of one row of a head_to_head table
+	MATCHUP_RECORD = np.dtype([
+		('matchups', np.int32), ('wins', np.int32),
+		('NR', np.float64), ('opp_NR', np.float64)
+	])
+
+	# Player -> record array of every round they played, sorted by date
+	PLAYER_ROUNDS = LazyDataset(lambda cls: cls.build_player_rounds())
+
+	# Player IDs and NRs of every round's contestants, grouped by round ID
+	ROUND_ENTRIES = LazyDataset(lambda cls: cls.build_round_entries())
+
+	# Name resolution index for true_name
+	NAMES = LazyDataset(lambda cls: NameIndex(cls.PLAYERS, cls.read_aliases()))
+
+	# Table of every season and round in the Data folder
+	CATALOG = LazyDataset(lambda cls: RoundCatalog(cls.ROUNDS, cls.season_folder))
+
+	# Datasets the commands use
+	PRELOAD = ["TABLES", "NAMES", "PLAYER_ROUNDS", "ROUND_ENTRIES", "CATALOG", "TOTM"]
 
-	with open(f'JSON Data/totm.json', encoding='utf-8') as f:
-		TOTM = json.load(f)
-		print("Loaded TOTM.JSON")
-	
 	@classmethod
-	def starting_date(cls, player):
-		"""Outputs the starting date of a player"""
+	def preload(cls):
+		"""Loads every dataset the commands use, e.g. from a background thread"""
+
+		for dataset in cls.PRELOAD:
+			getattr(cls, dataset)
+		
+		print("Preloaded all datasets")
+
 
-		return cls.RESULTDAILY[player][0]
-	
-	
 	@classmethod
-	def true_name(cls, player):
-		"""Convert an alias and/or arbitrary-case player name into official name"""
+	async def ready(cls, *datasets):
+		"""Waits until datasets (all of PRELOAD by default) are loaded
+
+		Ones that aren't loaded yet are loaded in a worker thread, so a
+		command run before the preload finishes doesn't block the event loop"""
+
+		loop = asyncio.get_event_loop()
+
+		with METRICS.waiting("data"):
+			for dataset in datasets or cls.PRELOAD:
+				if not cls.__dict__[dataset].loaded:
+					await loop.run_in_executor(None, getattr, cls, dataset)
 
-		PLAYERS = cls.RESULTDAILY.keys()
 
-		# If player is already a true name
-		if player in PLAYERS:
-			return player
+	@classmethod
+	def read_json(cls, name):
+		"""Parses one of the JSON data files"""
+
+		with open(f'{SNAPSHOT.JSON_FOLDER}/{name}.json', encoding='utf-8') as f:
+			return json.load(f)
+
+
+	@classmethod
+	def encode_records(cls):
+		"""Reads HISTORY, ROUNDS and TOTM from the JSON files and dictionary-encodes them
+
+		Player names come first in the string table, so that a player's ID is
+		also their row in the columnar store"""
+
+		strings = StringTable(cls.PLAYERS)
+
+		history = cls.read_json("history")
+		history_records = np.array([
+			(month, strings.intern(player), strings.intern(round_name), *round_info)
+			for month, month_history in enumerate(history)
+			for player, rounds in month_history.items()
+			for round_name, round_info in rounds.items()
+		], dtype=cls.HISTORY_RECORD)
+
+		rounds = cls.read_json("rounds")
+		rounds_records = np.array([
+			(month, strings.intern(round_name), *round_info)
+			for month, month_rounds in enumerate(rounds)
+			for round_name, round_info in month_rounds.items()
+		], dtype=cls.ROUNDS_RECORD)
+
+		totm = cls.read_json("totm")
+		totm_records = np.array([
+			(month, strings.intern(player), rating)
+			for month, month_totm in enumerate(totm)
+			for player, rating in month_totm.items()
+		], dtype=cls.TOTM_RECORD)
+
+		return {
+			"strings": strings.strings,
+			"history": history_records,
+			"rounds": rounds_records,
+			"totm": totm_records,
+			"history_months": len(history),
+			"rounds_months": len(rounds),
+			"totm_months": len(totm)
+		}
+
+
+	@classmethod
+	def decode_history(cls, records):
+		"""Decodes HISTORY records into {player: {round: [gain, rank, size]}}"""
+
+		decoded = {}
+
+		for player, round_id, gain, rank, size in zip(
+			*[records[field].tolist() for field in ["player", "round", "gain", "rank", "size"]]):
+
+			decoded.setdefault(cls.STRINGS[player], {})[cls.STRINGS[round_id]] = [gain, rank, size]
 		
-		player = player.lower()
+		return decoded
+
+
+	@classmethod
+	def decode_rounds(cls, records):
+		"""Decodes ROUNDS records into {round: [strength, date]}"""
 
-		lower_names = [x.lower() for x in PLAYERS]
+		return {
+			cls.STRINGS[round_id]: [strength, date]
+			for round_id, strength, date in zip(
+				*[records[field].tolist() for field in ["round", "strength", "date"]])
+		}
 
-		# If player is an arbitrary-case variation of a true name
-		if player in lower_names:
-			ind = lower_names.index(player)
 
-			return list(PLAYERS)[ind]
+	@classmethod
+	def decode_totm(cls, records):
+		"""Decodes TOTM records into {player: rating}"""
+
+		return {
+			cls.STRINGS[player]: rating
+			for player, rating in zip(records['player'].tolist(), records['rating'].tolist())
+		}
+
+
+	@classmethod
+	def build_store(cls):
+		"""Builds players x days matrices of every stat from RESULTDAILY and RANKS
+
+		Values are stored in the sheet scale and forward-filled, so that any
+		player's stats on any day are a single array lookup"""
+
+		players = list(cls.RESULTDAILY.keys())
+		player_rows = {player: row for row, player in enumerate(players)}
+
+		player_count = len(players)
+
+		start_days = np.zeros(player_count, dtype=np.int32)
+		rank_days = np.zeros(player_count, dtype=np.int32)
+
+		# Span the grid up to MAX_DATE, or further if any player's data goes past it
+		day_count = cls.day_index(DATES.MAX_DATE) + 1
+
+		for result in cls.RESULTDAILY.values():
+			day_count = max(day_count, cls.day_index(result[0]) + len(result) - 1)
+
+		score_t, RM_t, RD_t = [
+			np.full((player_count, day_count), default, dtype=np.float32)
+			for default in cls.DEFAULT_PLAYER_C[:3]
+		]
+		RP_t = np.zeros((player_count, day_count), dtype=np.int32)
+		rank_t = np.zeros((player_count, day_count), dtype=np.int32)
+
+		for row, result in enumerate(cls.RESULTDAILY.values()):
+			start = cls.day_index(result[0])
+			entries = result[1:]
+			end = start + len(entries)
+
+			start_days[row] = start
+
+			RD = np.array([entry[0] for entry in entries], dtype=np.float64)
+
+			# Incomplete entries only have [RD], so RM and RP are carried over
+			# from the latest complete entry before them
+			full = np.array([len(entry) > 1 for entry in entries])
+			carry = np.maximum.accumulate(np.where(full, np.arange(len(entries)), 0))
+
+			RM = np.zeros(len(entries), dtype=np.float64)
+			RP = np.zeros(len(entries), dtype=np.int32)
+
+			RM[full] = [entry[1] for entry in entries if len(entry) > 1]
+			RP[full] = [entry[2] for entry in entries if len(entry) > 1]
+
+			RM, RP = RM[carry], RP[carry]
+
+			score_t[row, start:end] = 5 * (RM - 2 * RD)
+			RM_t[row, start:end] = 5 * RM
+			RD_t[row, start:end] = 5 * RD
+			RP_t[row, start:end] = RP
+
+			# Hold the last known values until the end of the grid
+			score_t[row, end:] = score_t[row, end - 1]
+			RM_t[row, end:] = RM_t[row, end - 1]
+			RD_t[row, end:] = RD_t[row, end - 1]
+			RP_t[row, end:] = RP_t[row, end - 1]
 		
-		autocompletes = [x for x in lower_names if x.startswith(player)]
+		for player, rank_h in cls.RANKS.items():
+			if player not in player_rows:
+				continue
 
-		# If there's only one possible autocompletion for player
-		if len(autocompletes) == 1:
-			ind = lower_names.index(autocompletes[0])
+			row = player_rows[player]
+			start = cls.day_index(rank_h[0])
+			end = start + len(rank_h) - 1
 
-			return list(PLAYERS)[ind]
+			# Days past the end of the rank history are left unranked
+			rank_t[row, start:end] = rank_h[1:]
+			rank_days[row] = end - start
 		
-		with open('Data/alias.txt', 'r', encoding='utf-8') as f:
-			lower_aliases = f.read().lower().splitlines()
+		return {
+			"players": players,
+			"start": start_days,
+			"rank_days": rank_days,
+			"score": score_t,
+			"RM": RM_t,
+			"RD": RD_t,
+			"RP": RP_t,
+			"rank": rank_t
+		}
+
+
+	@classmethod
+	def build_player_rounds(cls):
+		"""Inverts the HISTORY records into one record array per player, joined
+		with the ROUNDS records by round ID"""
+
+		history = cls.RECORDS["history"]
+		rounds = cls.RECORDS["rounds"]
+
+		# Round ID -> strength and date
+		strengths = np.zeros(len(cls.STRINGS), dtype=np.float64)
+		dates = np.zeros(len(cls.STRINGS), dtype=np.int32)
 
-		# If player is an arbitrary-case variation of an alias
-		if player in lower_aliases:
-			cycled = [player]
+		strengths[rounds['round']] = rounds['strength']
+		dates[rounds['round']] = rounds['date']
 
-			while lower_aliases.index(player) % 2 == 0:
-				player = lower_aliases[lower_aliases.index(player) + 1]
+		records = np.zeros(len(history), dtype=cls.ROUND_RECORD)
 
-				if player in cycled:
-					break
-				
-				cycled.append(player)
+		for field in ["round", "month", "gain", "rank", "size"]:
+			records[field] = history[field]
 		
-		# If player is nowhere to be found in general
-		if player not in lower_names:
-			return False
+		records['strength'] = strengths[history['round']]
+		records['date'] = dates[history['round']]
+
+		with np.errstate(divide='ignore', invalid='ignore'):
+			records['NR'] = (records['size'] - records['rank']) / (records['size'] - 1)
+
+		# Group by player, then sort by date. lexsort is stable, so rounds on
+		# the same day keep their HISTORY order
+		order = np.lexsort((records['date'], history['player']))
+
+		records = records[order]
+		players = history['player'][order]
+
+		bounds = np.flatnonzero(np.diff(players)) + 1
+		starts = [0] + bounds.tolist()
+		ends = bounds.tolist() + [len(players)]
+
+		# Each player's array is a view into one contiguous records array
+		return {
+			cls.STRINGS[int(players[start])]: records[start:end]
+			for start, end in zip(starts, ends)
+			if end > start
+		}
+
+
+	@classmethod
+	def build_round_entries(cls):
+		"""Sorts the HISTORY records by round, so that the contestants of round
+		ID r are the entries between bounds[r] and bounds[r + 1]"""
+
+		history = cls.RECORDS["history"]
+
+		# Stable, so each round's contestants keep their HISTORY order
+		order = np.argsort(history['round'], kind='stable')
+		history = history[order]
+
+		with np.errstate(divide='ignore', invalid='ignore'):
+			NR = (history['size'] - history['rank']) / (history['size'] - 1)
+
+		return {
+			"player": history['player'],
+			"NR": NR,
+			"bounds": np.searchsorted(history['round'], np.arange(len(cls.STRINGS) + 1))
+		}
+
 
-		ind = lower_names.index(player)
-		player = list(PLAYERS)[ind]
-		return player
+	@classmethod
+	def day_index(cls, date):
+		"""Returns the store column of any date type"""
+
+		return DATES.day_diff(DATES.to_ID(date), DATES.MIN_DATE)
+
+
+	@classmethod
+	def starting_date(cls, player):
+		"""Outputs the starting date of a player"""
+
+		start = int(cls.START_DAYS[cls.PLAYER_ROWS[player]])
+
+		return DATES.date_add(DATES.MIN_DATE, days=start)
+	
+	
+	@classmethod
+	def true_name(cls, player):
+		"""Convert an alias and/or arbitrary-case player name into official name"""
+
+		return cls.NAMES.resolve(player)
+	
+	
+	@classmethod
+	def read_aliases(cls):
+		"""Reads the lines of the alias file (alternating alias and target)"""
+
+		try:
+			with open('Data/alias.txt', 'r', encoding='utf-8') as f:
+				return f.read().splitlines()
+		except FileNotFoundError:
+			return []
+	
 	
 	"""
 	---> Statistic gathering functions
@@ -104,21 +499,20 @@ class DATA():
 		"""Returns the leaderboard rank of a player on a given day"""
 
 		try:
-			P_RANKS = cls.RANKS[player]
+			row = cls.PLAYER_ROWS[player]
 		except KeyError:	# If player does not exist
 			return False
 
-		init_date = P_RANKS[0]
+		day = cls.day_index(date)
 
 		# If player hadn't played yet by the date specified
-		if date < init_date:
+		if day < cls.START_DAYS[row]:
 			return False
-		
-		date_ind = DATES.day_diff(date, init_date)
 
-		rank = P_RANKS[date_ind + 1]
-		
-		return rank
+		rank = int(cls.TABLES[4][row, day])
+
+		# A rank of 0 means the player wasn't ranked on the date specified
+		return rank if rank else False
 
 
 	@classmethod
@@ -127,42 +521,201 @@ class DATA():
 		
 		Can output directly in the sheet scale if convert is activated"""
 
-		convert = 5 if convert else 1
-
 		try:
-			PLAYER_RESULT = cls.RESULTDAILY[player]
+			row = cls.PLAYER_ROWS[player]
 		except KeyError:	# If player does not exist
 			return False
 
-		init_date = PLAYER_RESULT[0]
-		date = DATES.to_ID(date)
+		day = cls.day_index(date)
 
-		# If player hadn't played yet by the date specified
-		if date < init_date:
-			return cls.DEFAULT_PLAYER_C if convert else cls.DEFAULT_PLAYER
+		# If player hadn't played yet by the date specified. Unranked
+		# players are always reported with the sheet scale defaults
+		if day < cls.START_DAYS[row]:
+			return cls.DEFAULT_PLAYER_C
+
+		score, RM, RD = [float(table[row, day]) for table in cls.TABLES[:3]]
+		RP = int(cls.TABLES[3][row, day])
+
+		# The store is kept in the sheet scale
+		if not convert:
+			score, RM, RD = [value / 5 for value in (score, RM, RD)]
+
+		return [score, RM, RD, RP]
+
+
+	@classmethod
+	def player_rounds(cls, player):
+		"""Returns a record array (see ROUND_RECORD) of a player's rounds, sorted by date"""
+
+		try:
+			return cls.PLAYER_ROUNDS[player]
+		except KeyError:	# If player has not played any rounds
+			return np.zeros(0, dtype=cls.ROUND_RECORD)
+
+
+	@classmethod
+	def round_list(cls, records, fields):
+		"""Converts round records into lists of the given fields
+
+		The "round" field is output as the round's name"""
+
+		columns = [records[field].tolist() for field in fields]
+
+		if "round" in fields:
+			ind = fields.index("round")
+			columns[ind] = [cls.STRINGS[round_id] for round_id in columns[ind]]
 		
-		date_ind = DATES.day_diff(date, init_date)
+		return [list(row) for row in zip(*columns)]
 
-		date_info = PLAYER_RESULT[date_ind + 1]
 
-		# Incomplete date_info means only [RD], meaning RM and RP info
-		# is carried over from a previous day entry
-		if len(date_info) == 1:
-			RD = date_info[0]
+	@classmethod
+	def shared_rounds(cls, player_0, player_1):
+		"""Returns the round records of two players in every round they both played
 
-			for step_back in range(date_ind):
-				previous_info = PLAYER_RESULT[date_ind - step_back]
+		The two record arrays are aligned row by row and sorted by date"""
 
-				if len(previous_info) > 1:
-					RM, RP = previous_info[1:]
-					break
-			
+		rounds_0 = cls.player_rounds(player_0)
+		rounds_1 = cls.player_rounds(player_1)
+
+		# A player can only appear once per round, so the round IDs are unique
+		_, ind_0, ind_1 = np.intersect1d(
+			rounds_0['round'], rounds_1['round'], assume_unique=True, return_indices=True)
+		
+		# intersect1d sorts by round ID, so go back to player_0's date order
+		order = np.argsort(ind_0)
+
+		return rounds_0[ind_0[order]], rounds_1[ind_1[order]]
+
+
+	@classmethod
+	def head_to_head(cls, player, opponents=None):
+		"""Compares a player against many opponents in a single pass
+
+		Returns a record array (see MATCHUP_RECORD) with one row per opponent,
+		in the order given. Opponents default to every other player, in
+		PLAYERS order"""
+
+		records = cls.player_rounds(player)
+		entries = cls.ROUND_ENTRIES
+
+		# Every contestant of every round the player played, found through the
+		# round index instead of going through each opponent's rounds
+		starts = entries["bounds"][records['round']]
+		counts = entries["bounds"][records['round'] + 1] - starts
+
+		positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+
+		owners = entries["player"][positions]
+		NR = np.repeat(records['NR'], counts)
+		opp_NR = entries["NR"][positions]
+
+		# Matchups against each string ID. The player's own entries are
+		# counted too, but they're never one of the opponents
+		size = len(cls.STRINGS)
+
+		matchups = np.bincount(owners, minlength=size)
+		wins = np.bincount(owners, weights=NR > opp_NR, minlength=size)
+		NR_sums = np.bincount(owners, weights=NR, minlength=size)
+		opp_NR_sums = np.bincount(owners, weights=opp_NR, minlength=size)
+
+		if opponents is None:
+			# A player's ID is also their row
+			ids = np.arange(len(cls.PLAYERS))
+			ids = ids[ids != cls.STRINGS.id(player)]
+		else:
+			ids = np.array([cls.STRINGS.id(opponent) for opponent in opponents], dtype=np.int64)
+
+		# Opponents that aren't in the records have no matchups
+		known = ids >= 0
+		ids = ids[known]
+
+		table = np.zeros(len(known), dtype=cls.MATCHUP_RECORD)
+
+		table['matchups'][known] = matchups[ids]
+		table['wins'][known] = wins[ids]
+
+		# Opponents with no matchups get NaN averages
+		with np.errstate(divide='ignore', invalid='ignore'):
+			table['NR'] = np.nan
+			table['opp_NR'] = np.nan
+
+			table['NR'][known] = NR_sums[ids] / matchups[ids]
+			table['opp_NR'][known] = opp_NR_sums[ids] / matchups[ids]
+		
+		return table
+
+
+	@classmethod
+	def series(cls, player, start, end, stat=0):
+		"""Returns a read-only view of a player's stat between two dates (inclusive)
+
+		The stat can be an index or a name from STATS. Values are in the sheet
+		scale, and days before the player's debut hold the default player's values
+		(or 0 for ranks)"""
+
+		try:
+			row = cls.PLAYER_ROWS[player]
+		except KeyError:	# If player does not exist
+			return False
+
+		if isinstance(stat, str):
+			stat = [s.lower() for s in cls.STATS].index(stat.lower())
+
+		view = cls.TABLES[stat][row, cls.day_index(start):cls.day_index(end) + 1]
+		view.flags.writeable = False
+
+		return view
+
+
+	@classmethod
+	def bulk_series(cls, players, start, end, stat=0):
+		"""Returns a players x days array of a stat between two dates (inclusive),
+		along with the index of each player's first day of data in it
+
+		A player's data runs back from the end date until their debut, or for
+		ranks, until the last day they were unranked. The end date is always
+		included. Values are in the sheet scale, like player_info(convert=True)"""
+
+		if isinstance(stat, str):
+			stat = [s.lower() for s in cls.STATS].index(stat.lower())
+
+		rows = np.array([cls.PLAYER_ROWS[player] for player in players], dtype=np.int64)
+
+		# Days before MIN_DATE have no data for anyone
+		first_day = max(0, cls.day_index(start))
+		last_day = cls.day_index(end)
+
+		values = cls.TABLES[stat][rows, first_day:last_day + 1]
+
+		if stat == 4:
+			# A rank of 0 means unranked. Find the last such day before the end
+			unranked = values[:, :-1] == 0
+			last_unranked = np.argmax(unranked[:, ::-1], axis=1)
+
+			first_days = np.where(unranked.any(axis=1), unranked.shape[1] - last_unranked, 0)
+		
 		else:
-			RD, RM, RP = date_info[:3]
+			first_days = np.clip(cls.START_DAYS[rows] - first_day, 0, values.shape[1] - 1)
 		
-		score = RM - 2 * RD
+		return values, first_days
+
+
+	@classmethod
+	@functools.lru_cache(maxsize=64)
+	def day_order(cls, day):
+		"""Returns the store rows sorted by best score on a given day index
+
+		Orders are cached for the most recently requested days"""
 
-		return [score * convert, RM * convert, RD * convert, RP]
+		# NumPy would wrap negative days around to the end of the table
+		if day < 0:
+			raise IndexError(f"Day index {day} is before the first day")
+
+		# Stable sort so that tied players keep their data order
+		order = np.argsort(-cls.TABLES[0][:, day], kind='stable')
+		order.flags.writeable = False
+
+		return order
 
 
 	@classmethod
@@ -171,24 +724,28 @@ class DATA():
 		
 		If there is no limit, returns all players"""
 
-		date = DATES.to_ID(date)
+		day = cls.day_index(date)
 
-		date_rankings = []
+		score, RM, RD, RP = [table[:, day] for table in cls.TABLES[:4]]
 
-		PLAYERS = cls.RESULTDAILY.keys()
+		order = cls.day_order(day)
 
-		for player in PLAYERS:
-			score, RM, RD, RP = cls.player_info(player, date, convert=True)
-			
-			date_rankings.append([player, score, RM, RD, RP])
-		
-		date_rankings = sorted(date_rankings, key=lambda m: m[1], reverse=True)
-
-		if cutoff and min([p[3] for p in date_rankings]) < cls.RD_CUTOFF:
-			date_rankings = [p for p in date_rankings if p[3] < cls.RD_CUTOFF]
+		if cutoff and RD.min() < cls.RD_CUTOFF:
+			order = order[RD[order] < cls.RD_CUTOFF]
 		
 		if limit:
-			date_rankings = date_rankings[:limit]
+			order = order[:limit]
+		
+		date_rankings = [
+			[cls.PLAYERS[row], p_score, p_RM, p_RD, p_RP]
+			for row, p_score, p_RM, p_RD, p_RP in zip(
+				order.tolist(),
+				score[order].tolist(),
+				RM[order].tolist(),
+				RD[order].tolist(),
+				RP[order].tolist()
+			)
+		]
 		
 		return date_rankings
 	
@@ -203,133 +760,72 @@ class DATA():
 
 		If verbose, returns season_info on each one"""
 
-		with open('Data/index.txt', 'r', encoding='utf-8') as f:
-			season_list = f.read().splitlines()
-		
-		folder_list = os.listdir('Data')
-
-		# Seasons that are both in the season index and have a folder
-		valid_seasons = [
-			season_name
-			for season_name in season_list
-			if cls.season_folder(season_name) in folder_list
-		]
+		catalog = cls.CATALOG
 
 		if verbose:
-			for ind, season_name in enumerate(valid_seasons):
-				valid_seasons[ind] = cls.season_info(season_name)
+			return [catalog.season_info(season_name) for season_name in catalog.seasons]
 
-		return valid_seasons
+		return list(catalog.seasons)
 	
 	
 	@classmethod
 	def season_info(cls, season):
 		"""Outputs a list of overall statistics of a season"""
 
-		raw_info = cls.season_rounds(season)
-
-		info = [
-			season,										# 0 -> Season name
-			len(raw_info),								# 1 -> Amount of rounds
-			min([round[1] for round in raw_info]),		# 2 -> Starting date
-			max([round[1] for round in raw_info]),		# 3 -> Latest round date
-			np.mean([round[3] for round in raw_info])	# 4 -> Average round strength
-		]
-
-		return info
+		return cls.CATALOG.season_info(season)
 
 
 	@classmethod
 	def season_rounds(cls, season):
 		"""Outputs information on each round of a season"""
 		
-		folder_name = cls.season_folder(season)
-		round_list = os.listdir(f'Data/{folder_name}')
-
-		all_rounds = []
+		return cls.CATALOG.season_rounds(season)
 
-		for round_file in round_list:
-			with open(f'Data/{folder_name}/{round_file}', 'r', encoding='utf-8') as f:
-				round_info = f.read().splitlines()
 
-			round_number = round_file[:-4]
-			full_round_name = f"{season} R{round_number}"
-
-			round_date = int(round_info[0])
-			lookup_ind = DATES.month_diff(round_date, DATES.MIN_DATE)
-
-			# If the round isn't actually counted for TWOW Glicko
-			if full_round_name not in cls.ROUNDS[lookup_ind].keys():
-				continue
-
-			contestant_count = len(round_info) - 1
-
-			strength = cls.ROUNDS[lookup_ind][full_round_name][0]
+	@classmethod
+	def rounds_between(cls, start, end):
+		"""Outputs information on every round between two dates, sorted by date"""
 
-			all_rounds.append([
-				round_number,
-				round_date,
-				contestant_count,
-				strength
-			])
-		
-		return all_rounds
+		return cls.CATALOG.rounds_between(DATES.to_ID(start), DATES.to_ID(end))
 
 
 	@classmethod
 	def round_info(cls, season, round_n):
 		"""Outputs information on a single round and all its players"""
 
-		folder_name = cls.season_folder(season)
-
-		# If the round does not exist in the folder for that season
-		if f"{round_n}.txt" not in os.listdir(f'Data/{folder_name}'):
+		# If the round does not exist (or was not counted for TWOW Glicko)
+		if not (round_entry := cls.CATALOG.round_entry(season, round_n)):
 			return False
 
-		with open(f'Data/{folder_name}/{round_n}.txt', 'r', encoding='utf-8') as f:
-			round_info = f.read().splitlines()
-
-		round_date = int(round_info[0])
+		_, round_date, _, strength, contestants = round_entry
 		lookup_ind = DATES.month_diff(round_date, DATES.MIN_DATE)
 
 		full_round_name = f"{season} R{round_n}"
 
-		M_ROUNDS = cls.ROUNDS[lookup_ind]
-		M_HISTORY = cls.HISTORY[lookup_ind]
-
-		# If that round was not counted for TWOW Glicko
-		if full_round_name not in M_ROUNDS.keys():
-			return False
+		# This month's history records of this round only
+		M_HISTORY = cls.HISTORY.rows(lookup_ind)
+		M_HISTORY = M_HISTORY[M_HISTORY['round'] == cls.STRINGS.id(full_round_name)]
 
-		strength = M_ROUNDS[full_round_name][0]
+		round_gains = dict(zip(
+			[cls.STRINGS[player] for player in M_HISTORY['player'].tolist()],
+			M_HISTORY['gain'].tolist()
+		))
 
-		rankings = round_info[1:]
+		rankings = []
 		RM_change = []
 
-		for ind, name in enumerate(rankings):
-			name = name.strip()
-
+		for name in contestants:
 			# If this name does not map to any players
 			if not (name := cls.true_name(name)):
-				rankings[ind] = False
-				continue
-			
-			# If the name does map to any players but is not in the history this month
-			if name not in M_HISTORY:
-				rankings[ind] = False
 				continue
 			
-			# If name is in history but this round is not
-			if full_round_name not in M_HISTORY[name]:
-				rankings[ind] = False
+			# If the player has no history for this round
+			if name not in round_gains:
 				continue
 
-			RM_change.append(M_HISTORY[name][full_round_name][0])
+			RM_change.append(round_gains[name])
 
-			rankings[ind] = name
-		
-		# Remove entries that were changed into False
-		rankings = [cont for cont in rankings if cont]
+			rankings.append(name)
 		
 		return [round_date, rankings, RM_change, strength]
 
@@ -338,15 +834,20 @@ class DATA():
 	def is_valid_season(cls, season):
 		"""Determines if a season exists, and if so locates its sanitized name"""
 
-		season = season.lower()
-		dataset = cls.all_seasons()
+		return cls.CATALOG.lower_seasons.get(season.lower(), False)
 
-		try:	# Check in the all_seasons dataset
-			ind = [s.lower() for s in dataset].index(season)
-		except ValueError:
-			return False
+
+	@classmethod
+	def rebuild(cls, *datasets):
+		"""Rebuilds datasets from the files on disk and swaps them in atomically
+
+		Commands that are already running keep the version they started with"""
+
+		for dataset in datasets:
+			cls.__dict__[dataset].rebuild(cls)
 		
-		return dataset[ind]
+		# Orders cached from the previous tables
+		cls.day_order.cache_clear()
 
 
 	@classmethod
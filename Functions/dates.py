@@ -1,244 +1,447 @@
-from dateutil.relativedelta import relativedelta as delta
-import datetime as dt
-
-class DATES():
-	"""
-	Wrapper class for various datetime functions
-
-	Built for easy conversion between TWOW Glicko date IDs,
-	datetime objects, and [year, month, day] lists
-	"""
-
-	MIN_DATE = 160101	# First ever TWOW round
-	MAX_DATE = 201130	# Current point of data
-
-	MIN_YEAR = 2000		# Minimum and maximum values that are
-	MAX_YEAR = 2099		# considered years when parsing
-	
-	@classmethod
-	def as_YMD(cls, date):
-		"""Write any date type in YYYY-MM-DD format"""
-
-		date = cls.to_YMD(date)
-
-		date = '-'.join([f'{a:02}' for a in date])
-
-		return date
-
-
-	@classmethod
-	def as_FULL(cls, date, only_month=False):
-		"""Write any date type in full Month Day Year format"""
-
-		date = cls.to_DT(date)
-		
-		date = date.strftime("%B %Y" if only_month else "%B %d %Y")
-
-		return date
-	
-
-	@classmethod
-	def time_lookup_range(cls, tb1, tb2):
-		"""Return a specialized lookup range [day range, month index range]
-		from two arbitrary YMD lists"""
-
-		early_bound = cls.time_range(*tb1)[0]
-		late_bound = cls.time_range(*tb2)[1]
-
-		early_month = cls.month_diff(early_bound, cls.MIN_DATE)
-		late_month = cls.month_diff(late_bound, cls.MIN_DATE)
-
-		return [[early_bound, late_bound], [early_month, late_month]]
-
-
-	@classmethod
-	def time_range(cls, year, month=None, day=None):
-		"""Take a single arbitrary time and output its day range"""
-
-		early_bound = [
-			year,								# A year is mandatory and contains its own bound
-			(1 if month is None else month),	# If it's just a year, start from month 1
-			(1 if day is None else day)			# If it's just a month, start from day 1
-		]
-
-		late_bound = [
-			year,								# A year is mandatory and contains its own bound
-			(12 if month is None else month),	# If it's just a year, end at month 12
-			(31 if day is None else day)		# If it's just a month, end at day 31
-		]
-
-		# Iteratively check if late_bound is a valid date (sometimes it's
-		# not because it always assumes the month ends on a day 31 if unspecified)
-		while True:
-			try:
-				final_day = cls.to_DT(late_bound)
-				break # When a valid final_day is found, break the loop
-				
-			except ValueError:
-				# If the date is invalid, deincrement a day and try again
-				late_bound[2] -= 1
-		
-		final_day = cls.to_ID(final_day)
-		start_day = cls.to_ID(early_bound)
-
-		return [start_day, final_day]
-
-
-	@classmethod
-	def day_diff(cls, later, prior):
-		"""Difference in days between two dates of any type"""
-
-		later = cls.to_DT(later)
-		prior = cls.to_DT(prior)
-		
-		diff = (later - prior).days
-
-		return diff
-	
-	
-	@classmethod
-	def month_diff(cls, later, prior):
-		"""Difference in months between two dates of any type"""
-
-		later = cls.to_DT(later)
-		prior = cls.to_DT(prior)
-		
-		month_diff = delta(later, prior).months
-		month_diff += delta(later, prior).years * 12
-
-		return month_diff
-
-
-	@classmethod
-	def date_add(cls, date, days=0, months=0, years=0):
-		"""Add a certain number of days, months or years to any date type"""
-
-		parsed_date = cls.to_DT(date)
-		
-		parsed_date += delta(days=days, months=months, years=years)
-		
-		# Convert parseddate back to whichever format the original date was
-		if isinstance(date, int):
-			parsed_date = cls.to_ID(parsed_date)
-		elif isinstance(date, list):
-			parsed_date = cls.to_YMD(parsed_date)
-		
-		return parsed_date
-
-
-	@classmethod
-	def day_before(cls, date):
-		"""A 'yesterday' function for convenience"""
-
-		return cls.date_add(date, days=-1)
-	
-
-	"""
-	---> General conversion functions
-	"""
-
-	@classmethod
-	def to_DT(cls, date):
-		"""Converts any date type to DT"""
-
-		if isinstance(date, int): 		# Date ID to DT
-			date = cls.ID_to_DT(date)
-		elif isinstance(date, list):	# YMD list to DT
-			date = cls.YMD_to_DT(date)
-		
-		return date
-	
-
-	@classmethod
-	def to_ID(cls, date):
-		"""Converts any date type to date ID"""
-
-		if isinstance(date, dt.date):	# DT to date ID
-			date = cls.DT_to_ID(date)
-		elif isinstance(date, list):	# YMD list to date ID
-			date = cls.YMD_to_ID(date)
-		
-		return date
-	
-
-	@classmethod
-	def to_YMD(cls, date):
-		"""Converts any date type to YMD list"""
-
-		if isinstance(date, dt.date):	# DT to YMD list
-			date = cls.DT_to_YMD(date)
-		elif isinstance(date, int):		# Date ID to YMD list
-			date = cls.ID_to_YMD(date)
-		
-		return date
-	
-
-	"""
-	---> Individual conversion functions
-	"""
-
-	@classmethod
-	def YMD_to_DT(cls, ymd_list):
-		"""Converts YMD list to DT"""
-
-		year, month, day = ymd_list
-
-		date = dt.date(year, month, day)
-
-		return date
-	
-
-	@classmethod
-	def YMD_to_ID(cls, ymd_list):
-		"""Converts YMD list to date ID"""
-
-		year, month, day = ymd_list
-
-		date_ID = 10000 * (year % 100) + 100 * month + day
-
-		return date_ID
-	
-
-	@classmethod
-	def DT_to_ID(cls, date):
-		"""Converts DT to date ID"""
-
-		date_ID = int(date.strftime('%y%m%d'))
-
-		return date_ID
-	
-
-	@classmethod
-	def DT_to_YMD(cls, date):
-		"""Converts DT to YMD list"""
-
-		ymd_list = [date.year, date.month, date.day]
-
-		return ymd_list
-	
-
-	@classmethod
-	def ID_to_DT(cls, date_ID):
-		"""Converts date ID to DT"""
-
-		date_ID = str(date_ID)
-
-		year, month, day = (date_ID[:2], date_ID[2:4], date_ID[4:])
-		year = '20' + year
-
-		date = dt.date(int(year), int(month), int(day))
-
-		return date
-	
-	@classmethod
-	def ID_to_YMD(cls, date_ID):
-		"""Converts date ID to YMD list"""
-
-		date_ID = str(date_ID)
-
-		year, month, day = (date_ID[:2], date_ID[2:4], date_ID[4:])
-		year = '20' + year
-
-		ymd_list = [int(year), int(month), int(day)]
-
-		return ymd_list
\ No newline at end of file
+from dateutil.relativedelta import relativedelta as delta
+import datetime as dt
+import numpy as np
+import os
+
+class DATES():
+	"""
+	Wrapper class for various datetime functions
+
+	Built for easy conversion between TWOW Glicko date IDs,
+	datetime objects, and [year, month, day] lists
+	"""
+
+	MIN_DATE = 160101	# First ever TWOW round
+	MAX_DATE = int(os.getenv("GLICKO_MAX_DATE", "201130"))	# Current point of data
+
+	MIN_YEAR = 2000		# Minimum and maximum values that are
+	MAX_YEAR = 2099		# considered years when parsing
+
+	HORIZON = 301231	# Last date covered by the lookup tables below
+
+	# Lookup tables, built by build_tables() for every day from the start of
+	# MIN_DATE's year up to the end of HORIZON's year. Ordinals are day
+	# numbers and month indices are month numbers, both counted from there
+	FIRST_ID = None			# First date ID in the tables
+	ID_ORDINALS = None		# Date ID - FIRST_ID -> ordinal, or -1 if not a real date
+	ORDINAL_IDS = None		# Ordinal -> date ID
+	MONTH_STARTS = None		# Month index -> ordinal of its first day (plus one past the end)
+
+	@classmethod
+	def build_tables(cls, horizon=None):
+		"""Builds the date lookup tables, optionally up to a new horizon"""
+
+		if horizon is not None:
+			cls.HORIZON = horizon
+		
+		first_year = 2000 + cls.MIN_DATE // 10000
+		last_year = 2000 + cls.HORIZON // 10000
+
+		days = np.arange(
+			np.datetime64(f'{first_year}-01-01'),
+			np.datetime64(f'{last_year + 1}-01-01')
+		)
+		months = days.astype('datetime64[M]')
+
+		year = days.astype('datetime64[Y]').astype(np.int64) + 1970
+		month = months.astype(np.int64) % 12 + 1
+		day = (days - months).astype(np.int64) + 1
+
+		cls.ORDINAL_IDS = (10000 * (year % 100) + 100 * month + day).astype(np.int32)
+		cls.FIRST_ID = int(cls.ORDINAL_IDS[0])
+
+		cls.ID_ORDINALS = np.full(int(cls.ORDINAL_IDS[-1]) - cls.FIRST_ID + 1, -1, dtype=np.int32)
+		cls.ID_ORDINALS[cls.ORDINAL_IDS - cls.FIRST_ID] = np.arange(len(days), dtype=np.int32)
+
+		cls.MONTH_STARTS = np.append(np.flatnonzero(day == 1), len(days)).astype(np.int32)
+
+	
+	@classmethod
+	def as_YMD(cls, date):
+		"""Write any date type in YYYY-MM-DD format"""
+
+		date = cls.to_YMD(date)
+
+		date = '-'.join([f'{a:02}' for a in date])
+
+		return date
+
+
+	@classmethod
+	def as_FULL(cls, date, only_month=False):
+		"""Write any date type in full Month Day Year format"""
+
+		date = cls.to_DT(date)
+		
+		date = date.strftime("%B %Y" if only_month else "%B %d %Y")
+
+		return date
+	
+
+	@classmethod
+	def time_lookup_range(cls, tb1, tb2):
+		"""Return a specialized lookup range [day range, month index range]
+		from two arbitrary YMD lists"""
+
+		early_bound = cls.time_range(*tb1)[0]
+		late_bound = cls.time_range(*tb2)[1]
+
+		early_month = cls.month_diff(early_bound, cls.MIN_DATE)
+		late_month = cls.month_diff(late_bound, cls.MIN_DATE)
+
+		return [[early_bound, late_bound], [early_month, late_month]]
+
+
+	@classmethod
+	def time_range(cls, year, month=None, day=None):
+		"""Take a single arbitrary time and output its day range"""
+
+		early_bound = [
+			year,								# A year is mandatory and contains its own bound
+			(1 if month is None else month),	# If it's just a year, start from month 1
+			(1 if day is None else day)			# If it's just a month, start from day 1
+		]
+
+		late_bound = [
+			year,								# A year is mandatory and contains its own bound
+			(12 if month is None else month),	# If it's just a year, end at month 12
+			(31 if day is None else day)		# If it's just a month, end at day 31
+		]
+
+		# Iteratively check if late_bound is a valid date (sometimes it's
+		# not because it always assumes the month ends on a day 31 if unspecified)
+		while True:
+			try:
+				final_day = cls.to_DT(late_bound)
+				break # When a valid final_day is found, break the loop
+				
+			except ValueError:
+				# If the date is invalid, deincrement a day and try again
+				late_bound[2] -= 1
+		
+		final_day = cls.to_ID(final_day)
+		start_day = cls.to_ID(early_bound)
+
+		return [start_day, final_day]
+
+
+	@classmethod
+	def day_diff(cls, later, prior):
+		"""Difference in days between two dates of any type"""
+
+		if cls.in_tables(later, prior):
+			return int(cls.ID_ORDINALS[later - cls.FIRST_ID]) - int(cls.ID_ORDINALS[prior - cls.FIRST_ID])
+
+		later = cls.to_DT(later)
+		prior = cls.to_DT(prior)
+		
+		diff = (later - prior).days
+
+		return diff
+	
+	
+	@classmethod
+	def month_diff(cls, later, prior):
+		"""Difference in months between two dates of any type"""
+
+		if cls.in_tables(later, prior):
+			later_ordinal = int(cls.ID_ORDINALS[later - cls.FIRST_ID])
+			prior_ordinal = int(cls.ID_ORDINALS[prior - cls.FIRST_ID])
+
+			months = cls.month_index(later) - cls.month_index(prior)
+			shifted = cls.shift_month(prior, months)
+
+			# See month_diffs
+			if later_ordinal >= prior_ordinal and shifted > later_ordinal:
+				months -= 1
+			elif later_ordinal < prior_ordinal and shifted < later_ordinal:
+				months += 1
+			
+			return months
+
+		later = cls.to_DT(later)
+		prior = cls.to_DT(prior)
+		
+		month_diff = delta(later, prior).months
+		month_diff += delta(later, prior).years * 12
+
+		return month_diff
+
+
+	@classmethod
+	def date_add(cls, date, days=0, months=0, years=0):
+		"""Add a certain number of days, months or years to any date type"""
+
+		# Fractional days are left to relativedelta
+		if cls.in_tables(date) and isinstance(days, int):
+			month_index = cls.month_index(date) + months + 12 * years
+
+			if 0 <= month_index < len(cls.MONTH_STARTS) - 1:
+				ordinal = cls.shift_month(date, months + 12 * years) + days
+
+				if 0 <= ordinal < len(cls.ORDINAL_IDS):
+					return int(cls.ORDINAL_IDS[ordinal])
+
+		parsed_date = cls.to_DT(date)
+		
+		parsed_date += delta(days=days, months=months, years=years)
+		
+		# Convert parseddate back to whichever format the original date was
+		if isinstance(date, int):
+			parsed_date = cls.to_ID(parsed_date)
+		elif isinstance(date, list):
+			parsed_date = cls.to_YMD(parsed_date)
+		
+		return parsed_date
+
+
+	@classmethod
+	def day_before(cls, date):
+		"""A 'yesterday' function for convenience"""
+
+		return cls.date_add(date, days=-1)
+	
+
+	"""
+	---> Vectorized date ID arithmetic on the lookup tables
+	"""
+
+	@classmethod
+	def in_tables(cls, *dates):
+		"""Determines if all dates are valid date IDs covered by the lookup tables"""
+
+		for date in dates:
+			if not isinstance(date, int):
+				return False
+			
+			if not 0 <= date - cls.FIRST_ID < len(cls.ID_ORDINALS):
+				return False
+			
+			if cls.ID_ORDINALS[date - cls.FIRST_ID] < 0:
+				return False
+		
+		return True
+
+
+	@classmethod
+	def ordinals(cls, date_IDs):
+		"""Converts date IDs (numbers or NumPy arrays) to day ordinals"""
+
+		offsets = np.asarray(date_IDs) - cls.FIRST_ID
+
+		if np.any((offsets < 0) | (offsets >= len(cls.ID_ORDINALS))):
+			raise ValueError("date ID outside of the lookup tables")
+
+		ordinals = cls.ID_ORDINALS[offsets]
+
+		if np.any(ordinals < 0):
+			raise ValueError("invalid date ID")
+		
+		return ordinals
+	
+
+	@classmethod
+	def from_ordinals(cls, ordinals):
+		"""Converts day ordinals (numbers or NumPy arrays) to date IDs"""
+
+		ordinals = np.asarray(ordinals)
+
+		if np.any((ordinals < 0) | (ordinals >= len(cls.ORDINAL_IDS))):
+			raise ValueError("date outside of the lookup tables")
+		
+		return cls.ORDINAL_IDS[ordinals]
+
+
+	@classmethod
+	def day_diffs(cls, later, prior):
+		"""Differences in days between date IDs (numbers or NumPy arrays)"""
+
+		return cls.ordinals(later) - cls.ordinals(prior)
+
+
+	@classmethod
+	def month_diffs(cls, later, prior):
+		"""Differences in whole months between date IDs (numbers or NumPy arrays)
+
+		Counted like relativedelta: a month has only passed once the day of
+		the month is reached again (or the month ends before that)"""
+
+		later_ordinal = cls.ordinals(later)
+		prior_ordinal = cls.ordinals(prior)
+
+		months = cls.month_index(np.asarray(later)) - cls.month_index(np.asarray(prior))
+		shifted = cls.shift_months(np.asarray(prior), months)
+
+		# If that overshoots later, one fewer month has passed (or one more, backwards)
+		months = months - ((later_ordinal >= prior_ordinal) & (shifted > later_ordinal))
+		months = months + ((later_ordinal < prior_ordinal) & (shifted < later_ordinal))
+
+		return months
+
+
+	@classmethod
+	def dates_add(cls, date_IDs, days=0, months=0):
+		"""Adds months and then days to date IDs (numbers or NumPy arrays)"""
+
+		date_IDs = np.asarray(date_IDs)
+		cls.ordinals(date_IDs)
+
+		month_index = cls.month_index(date_IDs) + months
+
+		if np.any((month_index < 0) | (month_index >= len(cls.MONTH_STARTS) - 1)):
+			raise ValueError("date outside of the lookup tables")
+
+		return cls.from_ordinals(cls.shift_months(date_IDs, months) + days)
+
+
+	"""
+	---> Unchecked lookup table helpers
+	"""
+
+	@classmethod
+	def month_index(cls, date_ID):
+		"""Month index of a date ID"""
+
+		year = date_ID // 10000 - cls.FIRST_ID // 10000
+		month = date_ID // 100 % 100 - 1
+
+		return 12 * year + month
+
+
+	@classmethod
+	def shift_months(cls, date_IDs, months):
+		"""Ordinals of date IDs moved by a number of months, with the day clipped
+		to the end of the month like relativedelta does"""
+
+		month_index = cls.month_index(date_IDs) + months
+
+		month_start = cls.MONTH_STARTS[month_index]
+		month_length = cls.MONTH_STARTS[month_index + 1] - month_start
+
+		return month_start + np.minimum(date_IDs % 100, month_length) - 1
+
+
+	@classmethod
+	def shift_month(cls, date_ID, months):
+		"""shift_months for a single date ID, without the NumPy overhead"""
+
+		month_index = cls.month_index(date_ID) + months
+
+		month_start = int(cls.MONTH_STARTS[month_index])
+		month_length = int(cls.MONTH_STARTS[month_index + 1]) - month_start
+
+		return month_start + min(date_ID % 100, month_length) - 1
+
+
+	"""
+	---> General conversion functions
+	"""
+
+	@classmethod
+	def to_DT(cls, date):
+		"""Converts any date type to DT"""
+
+		if isinstance(date, int): 		# Date ID to DT
+			date = cls.ID_to_DT(date)
+		elif isinstance(date, list):	# YMD list to DT
+			date = cls.YMD_to_DT(date)
+		
+		return date
+	
+
+	@classmethod
+	def to_ID(cls, date):
+		"""Converts any date type to date ID"""
+
+		if isinstance(date, dt.date):	# DT to date ID
+			date = cls.DT_to_ID(date)
+		elif isinstance(date, list):	# YMD list to date ID
+			date = cls.YMD_to_ID(date)
+		
+		return date
+	
+
+	@classmethod
+	def to_YMD(cls, date):
+		"""Converts any date type to YMD list"""
+
+		if isinstance(date, dt.date):	# DT to YMD list
+			date = cls.DT_to_YMD(date)
+		elif isinstance(date, int):		# Date ID to YMD list
+			date = cls.ID_to_YMD(date)
+		
+		return date
+	
+
+	"""
+	---> Individual conversion functions
+	"""
+
+	@classmethod
+	def YMD_to_DT(cls, ymd_list):
+		"""Converts YMD list to DT"""
+
+		year, month, day = ymd_list
+
+		date = dt.date(year, month, day)
+
+		return date
+	
+
+	@classmethod
+	def YMD_to_ID(cls, ymd_list):
+		"""Converts YMD list to date ID"""
+
+		year, month, day = ymd_list
+
+		date_ID = 10000 * (year % 100) + 100 * month + day
+
+		return date_ID
+	
+
+	@classmethod
+	def DT_to_ID(cls, date):
+		"""Converts DT to date ID"""
+
+		date_ID = int(date.strftime('%y%m%d'))
+
+		return date_ID
+	
+
+	@classmethod
+	def DT_to_YMD(cls, date):
+		"""Converts DT to YMD list"""
+
+		ymd_list = [date.year, date.month, date.day]
+
+		return ymd_list
+	
+
+	@classmethod
+	def ID_to_DT(cls, date_ID):
+		"""Converts date ID to DT"""
+
+		date_ID = str(date_ID)
+
+		year, month, day = (date_ID[:2], date_ID[2:4], date_ID[4:])
+		year = '20' + year
+
+		date = dt.date(int(year), int(month), int(day))
+
+		return date
+	
+	@classmethod
+	def ID_to_YMD(cls, date_ID):
+		"""Converts date ID to YMD list"""
+
+		date_ID = str(date_ID)
+
+		year, month, day = (date_ID[:2], date_ID[2:4], date_ID[4:])
+		year = '20' + year
+
+		ymd_list = [int(year), int(month), int(day)]
+
+		return ymd_list
+
+
+DATES.build_tables()
\ No newline at end of file
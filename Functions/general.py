@@ -1,5 +1,9 @@
 from discord.ext import commands
-from PIL import ImageFont
+
+try:
+	from Functions.assets import ASSETS
+except ModuleNotFoundError:
+	from assets import ASSETS
 
 """
 Miscellaneous helper functions
@@ -29,8 +33,8 @@ def ensure_perms():
 		]
 	return commands.check(is_staff)
 
-# Returns the Assistant font in the given size
-Assistant = lambda size: ImageFont.truetype("Images/Fonts/Assistant-Regular.ttf", size)
+# Returns the Assistant font in the given size (cached)
+Assistant = lambda size: ASSETS.font("Assistant-Regular", size)
 
-# Returns the Assistant Bold font in the given size
-AssistantBold = lambda size: ImageFont.truetype("Images/Fonts/Assistant-Bold.ttf", size)
\ No newline at end of file
+# Returns the Assistant Bold font in the given size (cached)
+AssistantBold = lambda size: ASSETS.font("Assistant-Bold", size)
\ No newline at end of file
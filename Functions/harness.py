@@ -0,0 +1,271 @@
+import discord
+from discord.ext import commands
+
+try:
+	from Functions.metrics import METRICS
+	from Functions.paginator import PAGINATOR
+except ModuleNotFoundError:
+	from metrics import METRICS
+	from paginator import PAGINATOR
+
+import traceback
+import itertools
+import shutil
+import types
+import os
+
+class HarnessUser():
+	"""
+	Stand-in for a Discord user
+	"""
+
+	def __init__(self, user_id=0, name="Harness", bot=False):
+		self.id = user_id
+		self.name = name
+		self.bot = bot
+
+
+	def __str__(self):
+		return self.name
+
+
+	@property
+	def mention(self):
+		return f"<@{self.id}>"
+
+
+	def avatar_url_as(self, **kwargs):
+		return ""
+
+
+class HarnessAttachment():
+	"""
+	Stand-in for a file attached to a message, backed by a local file
+	"""
+
+	def __init__(self, path):
+		self.path = path
+		self.filename = os.path.basename(path)
+		self.size = os.path.getsize(path)
+
+
+	async def save(self, fp):
+		shutil.copyfile(self.path, fp)
+
+
+class HarnessMessage():
+	"""
+	Stand-in for a Discord message, reporting everything done to it to the harness
+	"""
+
+	def __init__(self, harness, channel, author, content="", attachments=()):
+		self.harness = harness
+		self.id = next(harness.ids)
+
+		self.channel = channel
+		self.guild = None
+		self.author = author
+		self.content = content
+		self.attachments = list(attachments)
+
+		self.reactions = []		# Emojis the bot reacted with
+
+
+	async def edit(self, content=None, embed=None, **kwargs):
+		if content is not None:
+			self.content = content
+
+		self.harness.show(self, content, embed, [], edited=True)
+
+
+	async def add_reaction(self, emoji):
+		self.reactions.append(str(emoji))
+
+
+	async def remove_reaction(self, emoji, member):
+		if member is self.harness.bot.user and str(emoji) in self.reactions:
+			self.reactions.remove(str(emoji))
+
+
+	async def clear_reactions(self):
+		self.reactions = []
+
+
+	async def delete(self):
+		pass
+
+
+class HarnessChannel():
+	"""
+	Stand-in for a Discord channel, where everything the bot sends is shown and saved
+	"""
+
+	def __init__(self, harness, channel_id=0, name="harness"):
+		self.harness = harness
+		self.id = channel_id
+		self.name = name
+
+		self.messages = []	# Everything sent to the channel, in order
+
+
+	async def send(self, content=None, embed=None, file=None, files=None, **kwargs):
+		files = ([] if file is None else [file]) + ([] if files is None else list(files))
+
+		message = HarnessMessage(self.harness, self, self.harness.bot.user,
+			content="" if content is None else str(content))
+
+		self.messages.append(message)
+		self.harness.show(message, content, embed, files)
+
+		return message
+
+
+class HarnessBot(commands.Bot):
+	"""
+	Bot that loads every command but never connects to Discord
+	"""
+
+	def __init__(self, **kwargs):
+		super().__init__(command_prefix="gl/", **kwargs)
+
+		self.harness_user = HarnessUser(user_id=1, name="Glicko Bot", bot=True)
+
+
+	@property
+	def user(self):
+		return self.harness_user
+
+
+	def add_cog(self, cog):
+		# Timed like the live bot's commands, for benchmarks
+		METRICS.instrument(cog)
+		super().add_cog(cog)
+
+
+class Harness():
+	"""
+	Runs the bot's commands without Discord
+
+	Commands are given the same fake message and channel objects the bot
+	would get from Discord: text they send is printed, files are saved to
+	a folder and reactions on paginated messages can be simulated. Staff
+	checks are skipped, since commands are called directly
+	"""
+
+	# Names that can be used for the paginator's reactions
+	REACTIONS = {
+		"prev": '⬅️', "next": '➡️', "sort": '⏺️', "reverse": '↕️'
+	}
+
+	def __init__(self, folder="Harness Output", user_id=0, quiet=False):
+		self.folder = folder	# Where files the commands send are saved
+		self.quiet = quiet		# Whether output is printed
+
+		self.ids = itertools.count(1)
+
+		self.user = HarnessUser(user_id=user_id)
+		self.bot = None
+		self.channel = None
+
+
+	async def start(self):
+		"""Creates the bot and loads every command, like main.py does"""
+
+		if self.bot is not None:
+			return
+
+		self.bot = HarnessBot()
+		self.bot.remove_command("help")
+
+		self.channel = HarnessChannel(self)
+
+		for cog in sorted(os.listdir("Commands")):
+			if not cog.endswith('py'):
+				continue
+
+			self.bot.load_extension(f"Commands.{cog[:-3]}")
+
+
+	async def run(self, text, attachments=()):
+		"""Runs a command, e.g. "gl/top 2020 11 30", and returns the messages it sent"""
+
+		await self.start()
+
+		args = text.split(" ")
+
+		if not args[0].lower().startswith("gl/"):
+			raise ValueError(f"{args[0]} is not a command: commands start with gl/")
+
+		command = self.bot.get_command(args[0][3:].lower())
+
+		if command is None:
+			raise ValueError(f"The command {args[0]} does not exist")
+
+		message = HarnessMessage(self, self.channel, self.user, content=text,
+			attachments=[HarnessAttachment(path) for path in attachments])
+
+		sent = len(self.channel.messages)
+
+		try:
+			await command.cog.run_command(message, args, len(args), None)
+
+		except Exception:
+			# Same as the bot's on_command_error, which would catch it live
+			if not self.quiet:
+				traceback.print_exc()
+
+		return self.channel.messages[sent:]
+
+
+	async def react(self, emoji, message=None):
+		"""Clicks a reaction (an emoji or a name in REACTIONS) as the command's author
+
+		Goes to the latest paginated message if none is given"""
+
+		emoji = self.REACTIONS.get(emoji, emoji)
+
+		if message is None:
+			paginated = [m for m in self.channel.messages if m.id in PAGINATOR.sessions]
+
+			if len(paginated) == 0:
+				raise ValueError("There's no paginated message to react to")
+
+			message = paginated[-1]
+
+		payload = types.SimpleNamespace(
+			message_id=message.id, user_id=self.user.id, emoji=emoji)
+
+		await PAGINATOR.react(payload)
+
+
+	def show(self, message, content, embed, files, edited=False):
+		"""Prints a message the bot sent or edited, and saves its files"""
+
+		if self.quiet:
+			return
+
+		print(f"--- {'Edited' if edited else 'Message'} {message.id} ---")
+
+		if content is not None:
+			print(content)
+
+		if embed is not None:
+			embed = embed.to_dict()
+
+			for key in ["title", "description"]:
+				if key in embed:
+					print(embed[key])
+
+			for field in embed.get("fields", []):
+				print(f"{field['name']}\n{field['value']}")
+
+		if len(files) != 0:
+			os.makedirs(self.folder, exist_ok=True)
+
+		for file in files:
+			path = f"{self.folder}/{file.filename}"
+
+			with open(path, 'wb') as f:
+				f.write(file.fp.read())
+
+			print(f"[Saved {path}]")
@@ -0,0 +1,314 @@
+import contextlib
+import contextvars
+import cProfile
+import pstats
+import bisect
+import asyncio
+import types
+import time
+import io
+import os
+
+class Histogram():
+	"""
+	Counts of durations in exponentially growing buckets, for percentiles
+
+	Buckets grow by 20% from 1 ms, so percentiles are accurate to within
+	20% whatever the scale, in constant memory
+	"""
+
+	# Upper bounds of the buckets, in seconds: 0 (nothing spent at all),
+	# then 1 ms up to about a minute
+	BOUNDS = [0] + [0.001 * 1.2 ** k for k in range(61)]
+
+	def __init__(self):
+		self.counts = [0] * (len(self.BOUNDS) + 1)	# The last bucket is for anything longer
+		self.count = 0
+		self.total = 0
+
+
+	def __len__(self):
+		return self.count
+
+
+	def add(self, seconds):
+		self.counts[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+		self.count += 1
+		self.total += seconds
+
+
+	def mean(self):
+		return self.total / self.count if self.count != 0 else 0
+
+
+	def percentile(self, q):
+		"""Returns the upper bound of the bucket the q-th percentile falls in"""
+
+		if self.count == 0:
+			return 0
+
+		rank = q / 100 * self.count
+		seen = 0
+
+		for bucket, count in enumerate(self.counts):
+			seen += count
+
+			if seen >= rank and count != 0:
+				break
+
+		return self.BOUNDS[min(bucket, len(self.BOUNDS) - 1)]
+
+
+class CommandRecord():
+	"""
+	Time one command run spent in each phase
+	"""
+
+	def __init__(self):
+		self.phases = {phase: 0 for phase in METRICS.PHASES}
+
+		# What the command is waiting on whenever it's suspended
+		self.waiting_on = "discord"
+
+
+class ProfileRequest():
+	"""
+	A request to profile the next few runs of a command
+	"""
+
+	def __init__(self, runs, callback):
+		self.profile = cProfile.Profile()
+		self.remaining = runs	# Runs left to start profiling
+		self.running = 0		# Profiled runs that haven't finished yet
+		self.callback = callback
+
+
+	def report(self, limit=40):
+		"""Returns the functions that took the most cumulative time"""
+
+		with io.StringIO() as stream:
+			stats = pstats.Stats(self.profile, stream=stream)
+			stats.sort_stats("cumulative").print_stats(limit)
+
+			return stream.getvalue()
+
+
+class METRICS():
+	"""
+	Latency and throughput of every command, split into phases
+
+	Commands are timed by stepping their coroutine: time spent running on
+	the event loop is "data" (lookups, sorting, building messages), and
+	time spent suspended is "discord" (API calls), unless it's awaiting
+	something marked with waiting(), like renders
+	"""
+
+	PHASES = ["data", "render", "discord"]
+
+	# Command -> phase (or "total") -> Histogram, since the bot started
+	HISTOGRAMS = {}
+
+	# Command -> runs since the last periodic summary
+	RECENT = {}
+
+	# The run being timed in the current task, if any
+	CURRENT = contextvars.ContextVar("CURRENT", default=None)
+
+	# Command -> ProfileRequest, only while someone asked for a profile
+	PROFILES = {}
+
+	# Seconds between summaries in the log. Set GLICKO_METRICS_INTERVAL to 0 to disable
+	LOG_INTERVAL = int(os.getenv("GLICKO_METRICS_INTERVAL", "3600"))
+	logger = None
+
+	@classmethod
+	def instrument(cls, cog):
+		"""Wraps a cog's run_command so that every run of it is timed"""
+
+		if not hasattr(cog, "run_command"):
+			return
+
+		run_command = cog.run_command
+		command = cog.qualified_name
+
+		async def timed_run_command(message, args, level, server):
+			return await cls.measure(command, run_command(message, args, level, server))
+
+		cog.run_command = timed_run_command
+
+
+	@classmethod
+	async def measure(cls, command, coroutine):
+		"""Awaits a command's coroutine, recording how long each phase took"""
+
+		record = CommandRecord()
+		token = cls.CURRENT.set(record)
+
+		# Only profiled if someone asked for it, at the cost of a lookup otherwise
+		request = cls.PROFILES.get(command)
+
+		if request is not None and request.remaining > 0:
+			request.remaining -= 1
+			request.running += 1
+		else:
+			request = None
+
+		start = time.perf_counter()
+
+		try:
+			return await cls.stepped(coroutine, record,
+				None if request is None else request.profile)
+
+		finally:
+			total = time.perf_counter() - start
+			cls.CURRENT.reset(token)
+
+			if request is not None:
+				request.running -= 1
+				cls.finish_profile(command, request)
+
+			histograms = cls.HISTOGRAMS.setdefault(command, {
+				phase: Histogram() for phase in ["total"] + cls.PHASES
+			})
+
+			histograms["total"].add(total)
+			for phase, seconds in record.phases.items():
+				histograms[phase].add(seconds)
+
+			cls.RECENT[command] = cls.RECENT.get(command, 0) + 1
+
+
+	@staticmethod
+	@types.coroutine
+	def stepped(coroutine, record, profile=None):
+		"""Drives a coroutine like await would, timing each step and each suspension
+
+		If a profile is given, it's enabled during the steps only, so it
+		leaves out whatever else runs while the coroutine is suspended"""
+
+		value, error = None, None
+
+		while True:
+			start = time.perf_counter()
+
+			if profile is not None:
+				profile.enable()
+
+			try:
+				if error is None:
+					awaited = coroutine.send(value)
+				else:
+					awaited = coroutine.throw(error)
+
+			except StopIteration as stop:
+				return stop.value
+
+			finally:
+				if profile is not None:
+					profile.disable()
+
+				suspended = time.perf_counter()
+				record.phases["data"] += suspended - start
+
+			waiting_on = record.waiting_on
+
+			value, error = None, None
+
+			try:
+				value = yield awaited
+
+			except GeneratorExit:
+				coroutine.close()
+				raise
+
+			except BaseException as thrown:	# e.g. cancellation, passed on to the command
+				error = thrown
+
+			record.phases[waiting_on] += time.perf_counter() - suspended
+
+
+	@classmethod
+	@contextlib.contextmanager
+	def waiting(cls, phase):
+		"""Marks the awaits inside the block as time spent on phase instead of Discord"""
+
+		record = cls.CURRENT.get()
+
+		if record is None:
+			yield
+			return
+
+		previous, record.waiting_on = record.waiting_on, phase
+
+		try:
+			yield
+		finally:
+			record.waiting_on = previous
+
+
+	@classmethod
+	def profile_next(cls, command, runs, callback):
+		"""Profiles the next runs of a command (by cog name)
+
+		Once they've all finished, callback is awaited with the report. A
+		newer request for the same command replaces the older one"""
+
+		cls.PROFILES[command] = ProfileRequest(runs, callback)
+
+
+	@classmethod
+	def finish_profile(cls, command, request):
+		"""Sends a profile's report once all of its runs are done"""
+
+		if request.remaining > 0 or request.running > 0:
+			return
+
+		if cls.PROFILES.get(command) is request:
+			del cls.PROFILES[command]
+
+		asyncio.ensure_future(request.callback(request.report()))
+
+
+	@classmethod
+	def table(cls):
+		"""Returns the percentiles of every command, in milliseconds"""
+
+		lines = [
+			"Command        Runs ||   p50    p95    p99 || Data p50 Render p50 Discord p50"
+		]
+
+		for command, histograms in sorted(cls.HISTOGRAMS.items()):
+			total = histograms["total"]
+			p50, p95, p99 = [1000 * total.percentile(q) for q in [50, 95, 99]]
+			phases = [1000 * histograms[phase].percentile(50) for phase in cls.PHASES]
+
+			lines.append(
+			f"{command:<13} {len(total):>5} || {p50:>5.0f}  {p95:>5.0f}  {p99:>5.0f} || "
+			+ f"{phases[0]:>8.0f} {phases[1]:>10.0f} {phases[2]:>11.0f}")
+
+		return "\n".join(lines)
+
+
+	@classmethod
+	def start_logging(cls):
+		"""Starts writing a summary to the log every LOG_INTERVAL seconds"""
+
+		if cls.logger is None and cls.LOG_INTERVAL > 0:
+			cls.logger = asyncio.ensure_future(cls.log_summaries())
+
+
+	@classmethod
+	async def log_summaries(cls):
+		while True:
+			await asyncio.sleep(cls.LOG_INTERVAL)
+
+			recent, cls.RECENT = cls.RECENT, {}
+			runs = sum(recent.values())
+
+			print(f"-[METRICS]- {runs} commands in the last {cls.LOG_INTERVAL // 60} minutes "
+				+ f"({60 * runs / cls.LOG_INTERVAL:.2f} per minute)")
+
+			for command, count in sorted(recent.items(), key=lambda c: -c[1]):
+				print(f"    {command}: {count}")
+
+			print(cls.table(), "\n")
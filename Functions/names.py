@@ -0,0 +1,177 @@
+import bisect
+import random
+import time
+
+class NameIndex():
+	"""
+	Precompiled index for turning arbitrary player names into true names
+
+	Built once from the player list and the alias file: case-folded names
+	are a dict, unique-prefix autocompletion is a bisect over the sorted
+	names and every alias chain is resolved ahead of time
+	"""
+
+	def __init__(self, players, alias_lines):
+		self.players = set(players)
+
+		# Lowercase name -> true name (the first player, if several share it)
+		self.lower_names = {}
+		for player in players:
+			self.lower_names.setdefault(player.lower(), player)
+
+		# Duplicates are kept so that ambiguous prefixes are still ambiguous
+		self.sorted_names = sorted([player.lower() for player in players])
+
+		self.aliases = self.compile_aliases([line.lower() for line in alias_lines])
+
+
+	def __len__(self):
+		return len(self.lower_names) + len(self.aliases)
+
+
+	def compile_aliases(self, lower_aliases):
+		"""Resolves every alias into the true name it points to
+
+		The alias file alternates lines of alias and target. Targets can be
+		aliases themselves, so chains are followed until they stop at a name
+		that isn't an alias (or loop back on themselves)"""
+
+		first_seen = {}
+		for ind, alias in enumerate(lower_aliases):
+			first_seen.setdefault(alias, ind)
+
+		resolved = {}
+
+		for alias in first_seen:
+			player = alias
+			cycled = {player}
+
+			while (first_seen[player] % 2 == 0
+			and first_seen[player] + 1 < len(lower_aliases)):
+				player = lower_aliases[first_seen[player] + 1]
+
+				if player in cycled:
+					break
+
+				cycled.add(player)
+
+			# Aliases that don't lead to an actual player are left out
+			if player in self.lower_names:
+				resolved[alias] = self.lower_names[player]
+
+		return resolved
+
+
+	def resolve(self, player):
+		"""Converts an alias and/or arbitrary-case player name into official name
+
+		Returns False if the name can't be matched to any player"""
+
+		# If player is already a true name
+		if player in self.players:
+			return player
+
+		player = player.lower()
+
+		# If player is an arbitrary-case variation of a true name
+		if player in self.lower_names:
+			return self.lower_names[player]
+
+		# Names starting with player sit in a contiguous block of sorted_names
+		start = bisect.bisect_left(self.sorted_names, player)
+		end = bisect.bisect_right(self.sorted_names, player + '\U0010ffff')
+
+		# If there's only one possible autocompletion for player
+		if end - start == 1:
+			return self.lower_names[self.sorted_names[start]]
+
+		# If player is an arbitrary-case variation of an alias
+		return self.aliases.get(player, False)
+
+
+def benchmark(players, alias_lines, lookups=2000, seed=0):
+	"""Times the NameIndex against the previous per-call true_name algorithm"""
+
+	player_set = set(players)
+
+	def legacy_true_name(player):
+		if player in player_set:
+			return player
+
+		player = player.lower()
+		lower_names = [x.lower() for x in players]
+
+		if player in lower_names:
+			return players[lower_names.index(player)]
+
+		autocompletes = [x for x in lower_names if x.startswith(player)]
+
+		if len(autocompletes) == 1:
+			return players[lower_names.index(autocompletes[0])]
+
+		# The file was re-read and lowercased on every call
+		lower_aliases = "\n".join(alias_lines).lower().splitlines()
+
+		if player in lower_aliases:
+			cycled = [player]
+
+			while lower_aliases.index(player) % 2 == 0:
+				player = lower_aliases[lower_aliases.index(player) + 1]
+
+				if player in cycled:
+					break
+
+				cycled.append(player)
+
+		if player not in lower_names:
+			return False
+
+		return players[lower_names.index(player)]
+
+	rng = random.Random(seed)
+
+	# A mix of exact names, case variations, prefixes, aliases and misses
+	queries = []
+	for _ in range(lookups):
+		kind = rng.randrange(5)
+		player = rng.choice(players)
+
+		if kind == 0:
+			queries.append(player)
+		elif kind == 1:
+			queries.append(player.upper())
+		elif kind == 2:
+			queries.append(player[:max(1, len(player) - 2)].lower())
+		elif kind == 3 and len(alias_lines) != 0:
+			queries.append(rng.choice(alias_lines))
+		else:
+			queries.append(f"{player} nobody")
+
+	start = time.perf_counter()
+	index = NameIndex(players, alias_lines)
+	build_time = time.perf_counter() - start
+
+	results = []
+
+	for resolver in [legacy_true_name, index.resolve]:
+		start = time.perf_counter()
+		answers = [resolver(query) for query in queries]
+		results.append([time.perf_counter() - start, answers])
+
+	(legacy_time, legacy_answers), (index_time, index_answers) = results
+
+	print(f"{len(players)} players, {len(alias_lines) // 2} aliases, {lookups} lookups")
+	print(f"Index build:      {1000 * build_time:.2f} ms")
+	print(f"Legacy true_name: {1e6 * legacy_time / lookups:.2f} µs per lookup")
+	print(f"NameIndex:        {1e6 * index_time / lookups:.2f} µs per lookup")
+	print(f"Matching results: {legacy_answers == index_answers}")
+
+
+if __name__ == "__main__":
+	# Benchmark entry point: python -m Functions.names
+	from Functions.data import DATA
+
+	with open('Data/alias.txt', 'r', encoding='utf-8') as f:
+		alias_lines = f.read().splitlines()
+
+	benchmark(list(DATA.PLAYERS), alias_lines)
@@ -0,0 +1,54 @@
+import discord
+
+from PIL import Image
+import io
+import os
+
+class OUTPUT():
+	"""
+	Encodes images and text exports in memory, ready to be uploaded
+
+	Nothing is written to disk: everything goes through BytesIO buffers
+	straight into discord.File objects
+	"""
+
+	# How images are encoded: "png", "palette" (PNG quantized to 256
+	# colors, much smaller) or "webp" (lossless WebP)
+	IMAGE_FORMAT = os.getenv("GLICKO_IMAGE_FORMAT", "png")
+
+	# zlib compression level of PNGs, from 0 (fastest) to 9 (smallest)
+	PNG_COMPRESSION = int(os.getenv("GLICKO_PNG_COMPRESSION", "6"))
+
+	EXTENSIONS = {"png": "png", "palette": "png", "webp": "webp"}
+
+	@classmethod
+	def encode_image(cls, image, image_format=None):
+		"""Encodes a Pillow image, returning [bytes, file extension]
+
+		Can run in a render worker, since the result is plain data"""
+
+		image_format = cls.IMAGE_FORMAT if image_format is None else image_format
+
+		buffer = io.BytesIO()
+
+		if image_format == "webp":
+			image.save(buffer, "WEBP", lossless=True)
+
+		else:
+			if image_format == "palette":
+				# Fast octree is the quantizer that keeps transparency
+				image = image.quantize(colors=256, method=Image.FASTOCTREE)
+
+			image.save(buffer, "PNG", compress_level=cls.PNG_COMPRESSION)
+
+		return [buffer.getvalue(), cls.EXTENSIONS[image_format]]
+
+
+	@classmethod
+	def file(cls, data, file_name):
+		"""Wraps bytes or text into a discord.File without touching the disk"""
+
+		if isinstance(data, str):
+			data = data.encode('utf-8')
+
+		return discord.File(io.BytesIO(data), filename=file_name)
\ No newline at end of file
@@ -0,0 +1,217 @@
+import discord
+
+import functools
+import asyncio
+import math
+
+class PageSession():
+	"""
+	State of one paginated message: its page, sorting and who can flip it
+	"""
+
+	def __init__(self, bot_user, author_id, message, gen_page, page_number, total_pages,
+		sort_info=None, sort_count=0):
+
+		self.bot_user = bot_user		# To remove the bot's own reactions when done
+		self.author_id = author_id		# Only the command's author can flip pages
+		self.message = message			# The paginated message
+
+		self.gen_page = gen_page
+		self.page_number = page_number
+		self.total_pages = total_pages
+
+		# [sort index, reversed] and the number of sorting methods, or None
+		# and 0 for commands that can't be sorted
+		self.sort_info = sort_info
+		self.sort_count = sort_count
+
+		if sort_info is None:
+			self.reactions = ['⬅️', '➡️']
+		else:
+			self.reactions = ['⬅️', '➡️', '⏺️', '↕️']
+
+		self.expires = 0				# Wheel tick at which the session ends
+		self.lock = asyncio.Lock()		# Reactions are handled one at a time
+
+		# (page, sort, reversed) -> page, as each one is only generated once
+		self.pages = {}
+
+
+	def page(self):
+		"""Returns the current page, generating it if it wasn't before"""
+
+		if self.sort_info is None:
+			key = (self.page_number, None, None)
+		else:
+			key = (self.page_number, self.sort_info[0], self.sort_info[1])
+
+		if key not in self.pages:
+			if self.sort_info is None:
+				self.pages[key] = self.gen_page(self.page_number)
+			else:
+				self.pages[key] = self.gen_page(self.page_number, sort=key[1], rev=key[2])
+
+		return self.pages[key]
+
+
+	def apply(self, emoji):
+		"""Updates the page or sorting according to a reaction"""
+
+		if emoji == '⬅️':
+			if self.page_number > 1:
+				self.page_number -= 1
+
+		if emoji == '➡️':
+			if self.page_number < self.total_pages:
+				self.page_number += 1
+
+		if emoji == '⏺️':
+			self.sort_info[0] += 1
+			self.sort_info[0] %= self.sort_count
+
+		if emoji == '↕️':
+			self.sort_info[1] = not self.sort_info[1]
+
+
+class Paginator():
+	"""
+	Handles the reactions of every paginated message in one place
+
+	Sessions are kept in a dict keyed by message ID, and the bot's single
+	on_raw_reaction_add event is routed to them, so an idle paginated
+	message costs no coroutine and no check per reaction event
+
+	Sessions expire after timeout seconds without a reaction. Expiry runs
+	on a timer wheel: one slot per resolution seconds, each holding the
+	sessions due on it. A session that was used after being slotted is
+	moved to the slot of its new deadline when its old slot comes up
+	"""
+
+	def __init__(self, timeout=120, resolution=1):
+		self.timeout = timeout			# Seconds a session lives without reactions
+		self.resolution = resolution	# Seconds per wheel slot
+
+		self.sessions = {}	# Message ID -> PageSession
+
+		# A deadline is at most timeout_ticks ahead, so it never wraps around
+		self.timeout_ticks = math.ceil(timeout / resolution)
+		self.wheel = [[] for _ in range(self.timeout_ticks + 1)]
+
+		self.tick = 0
+		self.ticker = None	# Turns the wheel while there are sessions
+
+
+	def __len__(self):
+		return len(self.sessions)
+
+
+	def open(self, BOT, author, message, gen_page, page_number, total_pages,
+		sort_info=None, sort_count=0):
+		"""Starts handling the reactions of a message whose first page was already sent
+
+		The command can return right away: the session lives on its own
+		until it expires. Omit sort_info for commands that can't be sorted"""
+
+		session = PageSession(BOT.user, author.id, message, gen_page, page_number,
+			total_pages, sort_info=sort_info, sort_count=sort_count)
+
+		self.sessions[message.id] = session
+		self.schedule(session)
+
+		if self.ticker is None:
+			self.ticker = asyncio.ensure_future(self.turn())
+
+		return session
+
+
+	def schedule(self, session):
+		"""Slots a new session on the wheel at its deadline"""
+
+		session.expires = self.tick + self.timeout_ticks
+		self.wheel[session.expires % len(self.wheel)].append(session.message.id)
+
+
+	async def react(self, payload):
+		"""Flips the page of a session according to a reaction, if it's for one"""
+
+		session = self.sessions.get(payload.message_id)
+
+		if (session is None
+		or payload.user_id != session.author_id
+		or str(payload.emoji) not in session.reactions):
+			return
+
+		emoji = str(payload.emoji)
+
+		# The deadline moves, but the session stays in its slot until it comes up
+		session.expires = self.tick + self.timeout_ticks
+
+		async with session.lock:
+			try:
+				await session.message.remove_reaction(emoji, discord.Object(id=payload.user_id))
+			except discord.errors.Forbidden:
+				pass
+
+			session.apply(emoji)
+
+			await session.message.edit(content=session.page())
+
+
+	async def turn(self):
+		"""Advances the wheel once per resolution, ending the sessions that are due"""
+
+		while len(self.sessions) != 0:
+			await asyncio.sleep(self.resolution)
+
+			self.tick += 1
+
+			slot = self.tick % len(self.wheel)
+			due, self.wheel[slot] = self.wheel[slot], []
+
+			for message_id in due:
+				session = self.sessions.get(message_id)
+
+				if session is None:
+					continue
+
+				# Used since it was slotted: move it to its new deadline
+				if session.expires > self.tick:
+					self.wheel[session.expires % len(self.wheel)].append(message_id)
+					continue
+
+				del self.sessions[message_id]
+				asyncio.ensure_future(self.close(session))
+
+		self.ticker = None
+
+
+	async def close(self, session):
+		"""Removes the reactions of an expired session's message"""
+
+		try:
+			try:
+				await session.message.clear_reactions()
+			except discord.errors.Forbidden:
+				for r in session.reactions:
+					await session.message.remove_reaction(r, session.bot_user)
+
+		# e.g. the message was deleted in the meantime
+		except discord.errors.HTTPException:
+			pass
+
+
+def sort_orders(items):
+	"""Returns a function that sorts items by one of their fields, like
+	sorted(items, key=lambda m: m[sort], reverse=rev)
+
+	Each (sort, rev) order is only sorted the first time it's asked for"""
+
+	@functools.lru_cache(maxsize=None)
+	def ordered(sort, rev):
+		return sorted(items, key=lambda m: m[sort], reverse=rev)
+
+	return ordered
+
+
+# Shared by every paginated command
+PAGINATOR = Paginator()
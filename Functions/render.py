@@ -0,0 +1,208 @@
+try:
+	from Functions.metrics import METRICS
+except ModuleNotFoundError:
+	from metrics import METRICS
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import OrderedDict, deque
+import asyncio
+import os
+
+class RenderQueueFull(Exception):
+	"""Raised when a render can't be queued because the pool is at capacity"""
+
+
+class RenderPool():
+	"""
+	Runs image rendering off the event loop, in a pool of worker processes
+
+	Jobs wait in one queue per user, and free workers take jobs from those
+	queues in turn, so a user sending many graphs can't hold up everyone
+	else. Both the total queue and each user's share of it are bounded
+
+	Render functions run in another process, so they have to be module
+	level functions that only take and return plain (picklable) data
+	"""
+
+	def __init__(self, workers=2, max_queued=20, max_per_user=3, processes=True):
+		self.workers = workers				# Jobs rendered at once
+		self.max_queued = max_queued		# Jobs waiting or rendering, over all users
+		self.max_per_user = max_per_user	# Jobs waiting or rendering, per user
+		self.processes = processes			# Worker processes, or threads if False
+
+		self.executor = None
+
+		# User -> deque of [function, args, future], in turn order
+		self.queues = OrderedDict()
+
+		self.pending = {}	# User -> jobs waiting or rendering
+		self.running = 0	# Jobs currently rendering
+
+
+	def __len__(self):
+		return sum(self.pending.values())
+
+
+	def start(self):
+		"""Creates the worker pool. Done on the first render if not called before"""
+
+		if self.executor is not None:
+			return
+
+		if self.processes:
+			self.executor = ProcessPoolExecutor(max_workers=self.workers)
+		else:
+			self.executor = ThreadPoolExecutor(max_workers=self.workers)
+
+
+	def has_room(self, user):
+		"""Determines if a job of user's could be queued right now"""
+
+		return len(self) < self.max_queued and self.pending.get(user, 0) < self.max_per_user
+
+
+	async def render(self, user, function, *args):
+		"""Runs function(*args) in a worker, queued under user, and returns its result
+
+		Raises RenderQueueFull if the pool or the user's share of it is full"""
+
+		with METRICS.waiting("render"):
+			return await self.submit(user, function, *args)
+
+
+	async def render_batch(self, user, function, arg_lists):
+		"""Renders function(*args) for every args in arg_lists, yielding the results in order
+
+		Only as many jobs as user is allowed are queued at a time, and the
+		next ones are queued as those finish, so batches of any size still
+		take turns with everyone else. Raises RenderQueueFull if there's no
+		room for a job even with none of the batch's own jobs queued"""
+
+		jobs = deque()
+
+		try:
+			for args in arg_lists:
+				# Wait on the batch's oldest job until there's room for another
+				while len(jobs) != 0 and not self.has_room(user):
+					yield await self.result(jobs.popleft())
+
+				jobs.append(self.submit(user, function, *args))
+
+			while len(jobs) != 0:
+				yield await self.result(jobs.popleft())
+
+		finally:
+			# If the batch was stopped early, drop the jobs it still had queued,
+			# so they never take a worker or count against anyone's share
+			for job in jobs:
+				job.cancel()
+
+			if len(jobs) != 0:
+				self.drop_cancelled(user)
+
+
+	async def result(self, future):
+		"""Awaits a job's future, timed as rendering"""
+
+		with METRICS.waiting("render"):
+			return await future
+
+
+	def submit(self, user, function, *args):
+		"""Queues function(*args) under user and returns a future of its result
+
+		Raises RenderQueueFull if the pool or the user's share of it is full"""
+
+		if len(self) >= self.max_queued:
+			raise RenderQueueFull(
+			"The bot is busy rendering other images right now. Try again in a bit!")
+
+		if self.pending.get(user, 0) >= self.max_per_user:
+			raise RenderQueueFull(
+			"You already have too many images being rendered. Wait for them to finish!")
+
+		self.start()
+
+		future = asyncio.get_event_loop().create_future()
+
+		self.queues.setdefault(user, deque()).append([function, args, future])
+		self.pending[user] = self.pending.get(user, 0) + 1
+
+		self.dispatch()
+
+		return future
+
+
+	def dispatch(self):
+		"""Hands queued jobs to free workers, one user at a time"""
+
+		loop = asyncio.get_event_loop()
+
+		while self.running < self.workers and len(self.queues) != 0:
+			# Take the next job of the user whose turn it is, then send
+			# that user to the back of the line if they have more jobs
+			user, queue = self.queues.popitem(last=False)
+			function, args, future = queue.popleft()
+
+			if len(queue) != 0:
+				self.queues[user] = queue
+
+			# Whoever queued it stopped waiting before it started
+			if future.cancelled():
+				self.release(user)
+				continue
+
+			self.running += 1
+
+			job = loop.run_in_executor(self.executor, function, *args)
+			job.add_done_callback(
+				lambda job, user=user, future=future: self.finish(job, user, future))
+
+
+	def drop_cancelled(self, user):
+		"""Removes user's queued jobs whose future was cancelled"""
+
+		if user not in self.queues:
+			return
+
+		queue = self.queues[user]
+		kept = deque(entry for entry in queue if not entry[2].cancelled())
+
+		for _ in range(len(queue) - len(kept)):
+			self.release(user)
+
+		if len(kept) != 0:
+			self.queues[user] = kept
+		else:
+			del self.queues[user]
+
+
+	def release(self, user):
+		"""Stops counting one of user's jobs as waiting or rendering"""
+
+		self.pending[user] -= 1
+		if self.pending[user] == 0:
+			del self.pending[user]
+
+
+	def finish(self, job, user, future):
+		"""Passes a finished job's result on and starts the next job"""
+
+		self.running -= 1
+		self.release(user)
+
+		# If whoever was waiting on the render has stopped waiting
+		if future.cancelled():
+			pass
+		elif job.cancelled():
+			future.cancel()
+		elif job.exception() is not None:
+			future.set_exception(job.exception())
+		else:
+			future.set_result(job.result())
+
+		self.dispatch()
+
+
+# Shared by every command. The worker count can be set with GLICKO_RENDER_WORKERS
+RENDER = RenderPool(workers=int(os.getenv("GLICKO_RENDER_WORKERS", "2")))
\ No newline at end of file
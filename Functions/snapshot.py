@@ -0,0 +1,155 @@
+import numpy as np
+import hashlib
+import json
+import os
+
+class SNAPSHOT():
+	"""
+	Compiled binary snapshot of the TWOW Glicko data
+
+	The snapshot is a folder of .npy arrays that can be memory-mapped at boot
+	instead of parsing the JSON files. All player and round names live in one
+	string table (a UTF-8 blob plus offsets) and are referenced by index
+	"""
+
+	FOLDER = 'Snapshot'			# Where the snapshot is compiled to
+	JSON_FOLDER = 'JSON Data'	# Where the source JSON files are
+
+	VERSION = 1		# Bumped whenever the layout below changes
+
+	STORE_ARRAYS = ["score", "RM", "RD", "RP", "rank", "start", "rank_days"]
+
+	# Dictionary-encoded records, as in DATA.RECORDS
+	RECORD_KEYS = [
+		"strings", "history", "rounds", "totm",
+		"history_months", "rounds_months", "totm_months"
+	]
+
+	@classmethod
+	def is_current(cls, folder=None):
+		"""Determines if there's a compiled snapshot at least as new as the JSON files"""
+
+		folder = cls.FOLDER if folder is None else folder
+
+		try:
+			with open(f'{folder}/meta.json', encoding='utf-8') as f:
+				meta = json.load(f)
+		except (FileNotFoundError, ValueError):
+			return False
+
+		if meta.get("version") != cls.VERSION:
+			return False
+
+		compiled = os.path.getmtime(f'{folder}/meta.json')
+
+		# If the JSON files were updated after the snapshot was compiled
+		for file_name in ["resultdaily", "history", "ranks", "rounds", "totm"]:
+			path = f'{cls.JSON_FOLDER}/{file_name}.json'
+
+			if os.path.exists(path) and os.path.getmtime(path) > compiled:
+				return False
+
+		return True
+
+
+	@classmethod
+	def fingerprint(cls, folder=None):
+		"""Returns a short hash of the size and modification time of every data file
+
+		It changes whenever the JSON files or the snapshot are replaced, so it
+		can tell apart anything derived from different versions of the data"""
+
+		folder = cls.FOLDER if folder is None else folder
+
+		paths = [f'{cls.JSON_FOLDER}/{file_name}.json'
+			for file_name in ["resultdaily", "history", "ranks", "rounds", "totm"]]
+		paths.append(f'{folder}/meta.json')
+
+		stamps = []
+
+		for path in paths:
+			if os.path.exists(path):
+				stat = os.stat(path)
+				stamps.append(f'{path}:{stat.st_size}:{stat.st_mtime_ns}')
+
+		return hashlib.sha1('\n'.join(stamps).encode('utf-8')).hexdigest()[:12]
+
+
+	@classmethod
+	def compile(cls, DATA, folder=None):
+		"""Writes a snapshot of a DATA class that was loaded from the JSON files"""
+
+		folder = cls.FOLDER if folder is None else folder
+		os.makedirs(folder, exist_ok=True)
+
+		# DATA.RECORDS is already encoded with player IDs matching the store rows
+		records = DATA.RECORDS
+		strings = records["strings"]
+
+		encoded = [name.encode('utf-8') for name in strings]
+		offsets = np.cumsum([0] + [len(name) for name in encoded], dtype=np.int64)
+
+		np.save(f'{folder}/strings.npy', np.frombuffer(b''.join(encoded), dtype=np.uint8))
+		np.save(f'{folder}/string_offsets.npy', offsets)
+
+		store = DATA.TABLES + [DATA.START_DAYS, DATA.RANK_DAYS]
+
+		for name, array in zip(cls.STORE_ARRAYS, store):
+			np.save(f'{folder}/{name}.npy', array)
+
+		for name in ["history", "rounds", "totm"]:
+			np.save(f'{folder}/{name}.npy', records[name])
+
+		# meta.json is written last, so a half-written snapshot is never loaded
+		with open(f'{folder}/meta.json', 'w', encoding='utf-8') as f:
+			json.dump({
+				"version": cls.VERSION,
+				"players": len(DATA.PLAYERS),
+				"history_months": records["history_months"],
+				"rounds_months": records["rounds_months"],
+				"totm_months": records["totm_months"]
+			}, f)
+
+		print(f"Compiled snapshot to {folder}/ ({len(strings)} strings)")
+
+
+	@classmethod
+	def load(cls, folder=None):
+		"""Memory-maps every array of a snapshot into a dict"""
+
+		folder = cls.FOLDER if folder is None else folder
+
+		with open(f'{folder}/meta.json', encoding='utf-8') as f:
+			snapshot = json.load(f)
+
+		for name in cls.STORE_ARRAYS + ["history", "rounds", "totm"]:
+			snapshot[name] = np.load(f'{folder}/{name}.npy', mmap_mode='r')
+
+		blob = bytes(np.load(f'{folder}/strings.npy', mmap_mode='r'))
+		offsets = np.load(f'{folder}/string_offsets.npy').tolist()
+
+		snapshot["strings"] = [
+			blob[start:end].decode('utf-8')
+			for start, end in zip(offsets[:-1], offsets[1:])
+		]
+
+		return snapshot
+
+
+	@classmethod
+	def store(cls, snapshot):
+		"""Returns the columnar store arrays, keyed like DATA.build_store()"""
+
+		store = {name: snapshot[name] for name in cls.STORE_ARRAYS}
+		store["players"] = snapshot["strings"][:snapshot["players"]]
+
+		return store
+
+
+if __name__ == "__main__":
+	# Converter entry point: python -m Functions.snapshot
+	from Functions.data import DATA
+
+	# Always compile from the JSON files, even if there's an older snapshot
+	DATA.USE_SNAPSHOT = False
+	SNAPSHOT.compile(DATA)
@@ -0,0 +1,603 @@
+try:
+	from Functions.calc import CALC
+	from Functions.dates import DATES
+	from Functions.data import DATA
+	from Functions.snapshot import SNAPSHOT
+except ModuleNotFoundError:
+	from calc import CALC
+	from dates import DATES
+	from data import DATA
+	from snapshot import SNAPSHOT
+
+import numpy as np
+import json
+import time
+import os
+
+# Building blocks of player and season names
+SYLLABLES = [
+	"ba", "bel", "bri", "da", "dra", "fen", "fi", "gol", "ha", "jin",
+	"ka", "kip", "lo", "lux", "mi", "mor", "ne", "nyx", "pol", "qua",
+	"ru", "rex", "sa", "sol", "ti", "tor", "vo", "vex", "wil", "ze"
+]
+
+def unique_names(rng, count, suffix=""):
+	"""Makes count names out of 2 or 3 syllables, unique even ignoring case
+
+	Names that were already taken get their index appended"""
+
+	parts = rng.integers(len(SYLLABLES), size=(count, 3)).tolist()
+	lengths = rng.integers(2, 4, size=count).tolist()
+
+	taken = set()
+	names = []
+
+	for ind in range(count):
+		name = "".join(SYLLABLES[s] for s in parts[ind][:lengths[ind]]).capitalize()
+
+		# Names have no digits, so the index alone makes it unique
+		if name.lower() in taken:
+			name += str(ind)
+
+		taken.add(name.lower())
+		names.append(name + suffix)
+
+	return names
+
+
+def encode(values, decimals=0):
+	"""Formats numbers as rows of ASCII bytes of the same width, for write_object
+
+	Zeros before the first significant digit (and the sign column of
+	positive numbers) are 0 bytes, which are dropped when written"""
+
+	values = np.asarray(values, dtype=np.float64)
+	scaled = np.rint(np.abs(values) * 10 ** decimals).astype(np.int64)
+
+	width = decimals + 1
+	if len(scaled) != 0:
+		width = max(width, len(str(scaled.max())))
+
+	# Sign, digits, and the decimal point if there are decimals
+	rows = np.zeros((len(values), 1 + width + (decimals != 0)), dtype=np.uint8)
+	rows[:, 0] = np.where((values < 0) & (scaled != 0), ord('-'), 0)
+
+	if decimals != 0:
+		rows[:, -decimals - 1] = ord('.')
+
+	# Digits from the last one, by repeated division
+	remaining = scaled
+
+	for position in range(width):
+		col = -position - 1 - (decimals != 0 and position >= decimals)
+
+		significant = remaining != 0
+		remaining, digit = np.divmod(remaining, 10)
+
+		# Leading zeros are padding, but not the units digit
+		if position > decimals:
+			rows[:, col] = np.where(significant, digit + ord('0'), 0)
+		else:
+			rows[:, col] = digit + ord('0')
+
+	return rows
+
+
+def column(char, count):
+	"""A column of one ASCII character, to put between encoded numbers"""
+
+	return np.full((count, 1), ord(char), dtype=np.uint8)
+
+
+class SyntheticData():
+	"""
+	Seeded generator of a complete dataset in the same format as the real one
+
+	Seasons run their rounds at their own pace over the years, and players
+	debut over time (more of them later on), each playing a handful of
+	rounds in a window after their debut. Every round is then played in
+	date order: contestants place by their hidden skill plus some luck, and
+	are rated with Glicko by CALC against everyone else in the round
+
+	Everything is vectorized with NumPy except the loop over rounds, and the
+	two big files (resultdaily and ranks) are serialized with NumPy too
+	"""
+
+	SKILL = [900, 100]		# Mean and deviation of the players' hidden skill (RM level)
+	LUCK = 200				# Deviation of a performance around the player's skill
+
+	ALIAS_RATE = 0.01		# Fraction of players with an alias
+	VARIANT_RATE = 0.1		# Fraction of names in round files written lowercase or as the alias
+
+	DECIMALS = 4			# Decimals of the RD, RM and gains written
+	CHUNK_ROWS = 2**20		# Entries serialized at once
+
+	def __init__(self, players=10000, seasons=100, rounds=20, contestants=50, years=None, seed=0):
+		self.player_count = players			# Players that can debut, if their rounds count
+		self.season_count = seasons
+		self.rounds_per_season = rounds
+		self.contestants = contestants		# Average contestants per round
+
+		self.rng = np.random.default_rng(seed)
+
+		# The data starts at MIN_DATE, and ends at MAX_DATE unless years are given
+		if years is None:
+			self.end_date = DATES.MAX_DATE
+		else:
+			self.end_date = DATES.date_add(DATES.MIN_DATE, years=years, days=-1)
+
+		if not DATES.in_tables(self.end_date) or self.end_date > DATES.HORIZON:
+			raise ValueError(f"The data can't go past {DATES.HORIZON}")
+
+		self.day_count = DATES.day_diff(self.end_date, DATES.MIN_DATE) + 1
+		self.month_count = DATES.month_diff(self.end_date, DATES.MIN_DATE) + 1
+
+		if self.day_count < self.rounds_per_season:
+			raise ValueError("A season's rounds have to be on different days")
+
+		# Day index -> date ID and month index
+		ordinals = DATES.ordinals(DATES.MIN_DATE) + np.arange(self.day_count)
+		self.day_IDs = DATES.from_ordinals(ordinals)
+		self.day_months = DATES.month_index(self.day_IDs) - DATES.month_index(DATES.MIN_DATE)
+
+
+	def generate(self, folder="."):
+		"""Generates the whole dataset into the JSON and Data folders of a folder"""
+
+		os.makedirs(f'{folder}/{SNAPSHOT.JSON_FOLDER}', exist_ok=True)
+		os.makedirs(f'{folder}/Data', exist_ok=True)
+
+		steps = [
+			["names", self.make_names],
+			["schedule", self.make_schedule],
+			["careers", self.make_careers],
+			["rounds", self.play_rounds],
+			["resultdaily", lambda: self.write_resultdaily(folder)],
+			["ranks", lambda: self.write_ranks(folder)],
+			["history, rounds and totm", lambda: self.write_records(folder)],
+			["round files", lambda: self.write_round_files(folder)]
+		]
+
+		for name, step in steps:
+			start = time.time()
+			step()
+			print(f"Generated {name} in {time.time() - start:.2f}s")
+
+		print(f"{len(self.players)} players and {len(self.round_days)} rounds "
+			+ f"from {DATES.MIN_DATE} to {self.end_date}")
+
+
+	def make_names(self):
+		self.player_names = unique_names(self.rng, self.player_count)
+		self.season_names = unique_names(self.rng, self.season_count, suffix=" TWOW")
+
+		# Some players go by another name too
+		self.aliases = {
+			player: f"The {self.player_names[player]}"
+			for player in self.rng.choice(self.player_count,
+				int(self.ALIAS_RATE * self.player_count), replace=False).tolist()
+		}
+
+
+	def make_schedule(self):
+		"""Spreads every season's rounds over the years, sorted by day"""
+
+		count = self.rounds_per_season
+
+		# Days between rounds, shortened for seasons that wouldn't fit otherwise
+		pace = np.minimum(self.rng.integers(5, 22, size=self.season_count),
+			self.day_count // count)
+
+		start = self.rng.integers(0, self.day_count - count * pace + 1)
+
+		# Each round lands anywhere in its own stretch of pace days
+		days = (start[:, np.newaxis] + pace[:, np.newaxis] * np.arange(count)
+			+ self.rng.integers(0, pace[:, np.newaxis], size=(self.season_count, count)))
+
+		seasons = np.repeat(np.arange(self.season_count), count)
+		numbers = np.tile(np.arange(1, count + 1), self.season_count)
+
+		order = np.lexsort((numbers, seasons, days.ravel()))
+
+		self.round_days = days.ravel()[order]
+		self.round_seasons = seasons[order]
+		self.round_numbers = numbers[order]
+
+
+	def make_careers(self):
+		"""Picks the rounds every player takes part in"""
+
+		round_count = len(self.round_days)
+
+		# Enough rounds per player to fill the rounds to the average size
+		mean_rounds = max(1, round_count * self.contestants / self.player_count)
+
+		# More players debut later, as the community grows
+		debuts = (round_count * np.sqrt(self.rng.random(self.player_count))).astype(np.int64)
+
+		counts = np.minimum(self.rng.geometric(1 / mean_rounds, size=self.player_count),
+			round_count - debuts)
+
+		# A career spans a few times as many rounds as it has
+		spans = np.minimum(counts * self.rng.integers(2, 6, size=self.player_count),
+			round_count - debuts)
+
+		players = np.repeat(np.arange(self.player_count), counts)
+		offsets = (self.rng.random(len(players)) * np.repeat(spans, counts)).astype(np.int64)
+
+		# Every career starts on its debut round
+		offsets[np.cumsum(counts) - counts] = 0
+
+		rounds = np.repeat(debuts, counts) + offsets
+
+		# Drawn twice, a round is only played once
+		pairs = np.unique(rounds * self.player_count + players)
+		rounds, players = pairs // self.player_count, pairs % self.player_count
+
+		# Rounds need at least two contestants to count
+		sizes = np.bincount(rounds, minlength=round_count)
+		played = sizes[rounds] >= 2
+
+		rounds, players = rounds[played], players[played]
+
+		kept = sizes >= 2
+		renumbered = np.cumsum(kept) - 1
+
+		self.round_days = self.round_days[kept]
+		self.round_seasons = self.round_seasons[kept]
+		self.round_numbers = self.round_numbers[kept]
+
+		# Contestants of every round, grouped by round
+		self.round_players = players
+		self.round_bounds = np.append(0, np.cumsum(np.bincount(renumbered[rounds],
+			minlength=len(self.round_days))))
+
+		self.skill = self.rng.normal(*self.SKILL, size=self.player_count)
+
+
+	@staticmethod
+	def rate(RM, RD, opp_RM, opp_RD, ranks):
+		"""Glicko update of a round's contestants, each matched against every other one
+
+		The matchups are weighted so that they add up to the round's weight"""
+
+		weight = CALC.round_weight(len(ranks)) / (len(ranks) - 1)
+
+		E = CALC.E(RM[:, np.newaxis], opp_RM[np.newaxis, :], opp_RD[np.newaxis, :])
+		G = CALC.G(opp_RD)[np.newaxis, :]
+
+		won = ranks[:, np.newaxis] < ranks[np.newaxis, :]
+
+		# Nobody is matched against themselves
+		surprise = G * (won - E)
+		information = G**2 * E * (1 - E)
+
+		np.fill_diagonal(surprise, 0)
+		np.fill_diagonal(information, 0)
+
+		new_RD = np.sqrt(1 / (1 / RD**2 + CALC.Q**2 * weight * information.sum(axis=1)))
+		new_RM = RM + CALC.Q * new_RD**2 * weight * surprise.sum(axis=1)
+
+		return new_RM, new_RD
+
+
+	def play_rounds(self):
+		"""Plays every round in date order, recording every rating change"""
+
+		_, default_RM, default_RD, _ = DATA.DEFAULT_PLAYER
+
+		RM = np.full(self.player_count, default_RM, dtype=np.float64)
+		RD = np.full(self.player_count, default_RD, dtype=np.float64)
+		RP = np.zeros(self.player_count, dtype=np.int64)
+		updated = np.zeros(self.player_count, dtype=np.int64)	# Day of the last rating change
+
+		# Ratings of the month, which start over from the default every month
+		month_RM = np.zeros(self.player_count, dtype=np.float64)
+		month_RD = np.zeros(self.player_count, dtype=np.float64)
+		month_updated = np.zeros(self.player_count, dtype=np.int64)
+		months = np.full(self.player_count, -1, dtype=np.int64)
+
+		self.strengths = np.zeros(len(self.round_days))
+		self.ranks = np.zeros(len(self.round_players), dtype=np.int64)
+
+		events = []			# [players, day, RD, RM, RP] after each round
+		history = []		# [gains, month ratings] of each round's contestants
+
+		for ind, day in enumerate(self.round_days.tolist()):
+			bound = slice(self.round_bounds[ind], self.round_bounds[ind + 1])
+			players = self.round_players[bound]
+			size = len(players)
+
+			old_RM = RM[players]
+			old_RD = CALC.decay_RD(RD[players], day - updated[players])
+
+			# Places by skill plus luck
+			performance = self.skill[players] + self.rng.normal(0, self.LUCK, size=size)
+
+			ranks = np.zeros(size, dtype=np.int64)
+			ranks[np.argsort(-performance)] = np.arange(1, size + 1)
+
+			new_RM, new_RD = self.rate(old_RM, old_RD, old_RM, old_RD, ranks)
+
+			RM[players], RD[players], updated[players] = new_RM, new_RD, day
+			RP[players] += 1
+
+			# Same round, starting from the default if it's the player's first this month
+			month = self.day_months[day]
+			first = months[players] != month
+
+			month_RM[players[first]] = default_RM
+			month_RD[players[first]] = default_RD
+			month_updated[players[first]] = day
+			months[players] = month
+
+			month_RM[players], month_RD[players] = self.rate(
+				month_RM[players],
+				CALC.decay_RD(month_RD[players], day - month_updated[players]),
+				old_RM, old_RD, ranks)
+
+			month_updated[players] = day
+
+			self.strengths[ind] = 5 * old_RM.mean() - 500
+			self.ranks[bound] = ranks
+
+			events.append([players, np.full(size, day), new_RD, new_RM, RP[players]])
+			history.append([5 * (new_RM - old_RM), month_RM[players]])
+
+		# Every rating change, by player and then in the order they happened
+		players, days, RDs, RMs, RPs = [np.concatenate(e) for e in zip(*events)]
+		order = np.argsort(players, kind='stable')
+
+		players, days, RDs, RMs, RPs = [a[order] for a in [players, days, RDs, RMs, RPs]]
+
+		# Only the last rating of each day is kept
+		last = np.append((players[1:] != players[:-1]) | (days[1:] != days[:-1]), True)
+
+		self.events = [a[last] for a in [players, days, RDs, RMs, RPs]]
+
+		self.gains, self.month_ratings = [np.concatenate(h) for h in zip(*history)]
+
+		self.players = np.unique(self.round_players)
+
+
+	def days_until(self, RD, target):
+		"""Days an RD takes to decay up to at least target (one more, to be safe)"""
+
+		growth = CALC.C**2 / 30
+
+		# Below 50, RD is pulled up towards 50 first, which takes at most 45 days
+		days = np.ceil((target**2 - np.maximum(RD, 50)**2) / growth) + 1
+		days += np.where(RD < 50, 45, 0)
+
+		return np.maximum(days, 0).astype(np.int64)
+
+
+	def segments(self):
+		"""Returns the stretch of days each rating change lasts for
+
+		Changes last until the player's next one, and a player's last change
+		lasts until the end date, like in the real exports"""
+
+		players, days = self.events[:2]
+
+		lengths = np.append(days[1:] - days[:-1], 0)
+		last = np.append(players[1:] != players[:-1], True)
+
+		lengths[last] = self.day_count - days[last]
+
+		return lengths
+
+
+	def write_object(self, path, keys, starts, counts, rows):
+		"""Writes a JSON object of {key: [start, *entries]}, CHUNK_ROWS entries at a time
+
+		rows(first, last) returns the entries between two indices encoded by
+		encode, as entries of every key follow each other"""
+
+		ends = np.cumsum(counts)
+		begins = ends - counts
+
+		with open(path, 'wb') as f:
+			f.write(b"{")
+
+			separator = b""
+			key = 0
+
+			while key < len(keys):
+				# As many keys as fit in the chunk, but at least one
+				last_key = max(key + 1,
+					int(np.searchsorted(ends, begins[key] + self.CHUNK_ROWS, side='right')))
+
+				chunk = rows(begins[key], ends[last_key - 1])
+
+				# Entries are separated by commas, except the last one of each key
+				commas = column(',', len(chunk))
+				commas[ends[key:last_key] - begins[key] - 1] = 0
+
+				chunk = np.hstack([chunk, commas])
+
+				kept = chunk != 0
+				data = chunk[kept].tobytes()
+
+				# Byte offsets of each key's entries in data
+				offsets = np.append(0, np.cumsum(kept.sum(axis=1)))[
+					np.append(0, ends[key:last_key] - begins[key])].tolist()
+
+				for ind in range(key, last_key):
+					offset = ind - key
+
+					f.write(separator + json.dumps(keys[ind]).encode('utf-8')
+						+ f": [{starts[ind]},".encode('utf-8')
+						+ data[offsets[offset]:offsets[offset + 1]] + b"]")
+
+					separator = b", "
+
+				key = last_key
+
+			f.write(b"}")
+
+
+	def write_resultdaily(self, folder):
+		"""Writes every player's [RD] of each day, or [RD, RM, RP] on days they played"""
+
+		players, days, RDs, RMs, RPs = self.events
+
+		lengths = self.segments()
+		begins = np.cumsum(lengths) - lengths
+
+		firsts = np.flatnonzero(np.append(True, players[1:] != players[:-1]))
+
+		def rows(first, last):
+			segment_range = np.searchsorted(begins, [first, last])
+			segments = np.arange(*segment_range)
+
+			segment = np.repeat(segments, lengths[segments])
+			offset = np.arange(first, last) - begins[segment]
+
+			full = (offset == 0)[:, np.newaxis]
+			count = len(segment)
+
+			return np.hstack([
+				column('[', count),
+				encode(CALC.decay_RD(RDs[segment], offset), self.DECIMALS),
+				column(',', count) * full,
+				encode(RMs[segment], self.DECIMALS) * full,
+				column(',', count) * full,
+				encode(RPs[segment]) * full,
+				column(']', count)
+			])
+
+		self.write_object(f'{folder}/{SNAPSHOT.JSON_FOLDER}/resultdaily.json',
+			[self.player_names[p] for p in players[firsts].tolist()],
+			self.day_IDs[days[firsts]].tolist(),
+			np.add.reduceat(lengths, firsts),
+			rows)
+
+
+	def write_ranks(self, folder):
+		"""Writes every player's leaderboard rank of each day, from the first day
+		they were on it until the end date (0 for days they weren't)"""
+
+		players, days, RDs, RMs, _ = self.events
+
+		lengths = self.segments()
+
+		# Only rating changes that leave RD under the cutoff are ranked, and only
+		# until RD decays back over it
+		cutoff = DATA.RD_CUTOFF / 5
+		lengths = np.where(RDs < cutoff, np.minimum(lengths, self.days_until(RDs, cutoff)), 0)
+
+		segment = np.repeat(np.arange(len(lengths)), lengths)
+		offset = np.arange(len(segment)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+		RD = CALC.decay_RD(RDs[segment], offset)
+		ranked = RD < cutoff
+
+		segment, RD = segment[ranked], RD[ranked]
+		day = days[segment] + offset[ranked]
+		player = players[segment]
+
+		# Ranked by score among everyone ranked that day
+		order = np.lexsort((-(RMs[segment] - 2 * RD), day))
+		day, player = day[order], player[order]
+
+		rank = np.arange(len(day)) - np.searchsorted(day, day) + 1
+
+		order = np.lexsort((day, player))
+		day, player, rank = day[order], player[order], rank[order]
+
+		firsts = np.flatnonzero(np.append(True, player[1:] != player[:-1]))
+
+		counts = self.day_count - day[firsts]
+		begins = np.cumsum(counts) - counts
+
+		dense = np.zeros(counts.sum(), dtype=np.int64)
+		dense[np.repeat(begins - day[firsts], np.diff(np.append(firsts, len(player)))) + day] = rank
+
+		self.write_object(f'{folder}/{SNAPSHOT.JSON_FOLDER}/ranks.json',
+			[self.player_names[p] for p in player[firsts].tolist()],
+			self.day_IDs[day[firsts]].tolist(),
+			counts,
+			lambda first, last: encode(dense[first:last]))
+
+
+	def round_name(self, ind):
+		return f"{self.season_names[self.round_seasons[ind]]} R{self.round_numbers[ind]}"
+
+
+	def write_records(self, folder):
+		"""Writes history, rounds and totm, which are grouped by month"""
+
+		history = [{} for _ in range(self.month_count)]
+		rounds = [{} for _ in range(self.month_count)]
+		totm = [{} for _ in range(self.month_count)]
+
+		sizes = np.diff(self.round_bounds)
+		round_inds = np.repeat(np.arange(len(sizes)), sizes)
+
+		round_names = [self.round_name(ind) for ind in range(len(sizes))]
+		round_months = self.day_months[self.round_days].tolist()
+
+		for ind, player, gain, rank, rating in zip(
+			round_inds.tolist(),
+			self.round_players.tolist(),
+			np.round(self.gains, self.DECIMALS).tolist(),
+			self.ranks.tolist(),
+			np.round(self.month_ratings, self.DECIMALS).tolist()):
+
+			month = round_months[ind]
+			name = self.player_names[player]
+
+			history[month].setdefault(name, {})[round_names[ind]] = [gain, rank, int(sizes[ind])]
+
+			# Later rounds of the month overwrite the rating
+			totm[month][name] = rating
+
+		for name, month, strength, day in zip(round_names, round_months,
+			np.round(self.strengths, self.DECIMALS).tolist(), self.round_days.tolist()):
+
+			rounds[month][name] = [strength, int(self.day_IDs[day])]
+
+		for file_name, records in [["history", history], ["rounds", rounds], ["totm", totm]]:
+			with open(f'{folder}/{SNAPSHOT.JSON_FOLDER}/{file_name}.json', 'w', encoding='utf-8') as f:
+				json.dump(records, f)
+
+
+	def write_round_files(self, folder):
+		"""Writes the season index, the alias file and every round's file, with
+		contestants in order of rank and some names written as variants"""
+
+		with open(f'{folder}/Data/index.txt', 'w', encoding='utf-8') as f:
+			f.write("\n".join(self.season_names))
+
+		with open(f'{folder}/Data/alias.txt', 'w', encoding='utf-8') as f:
+			f.write("\n".join(
+				line for player, alias in self.aliases.items()
+				for line in [alias, self.player_names[player]]))
+
+		for season in self.season_names:
+			os.makedirs(f'{folder}/Data/{DATA.season_folder(season)}', exist_ok=True)
+
+		variants = self.rng.random(len(self.round_players)) < self.VARIANT_RATE
+
+		for ind in range(len(self.round_days)):
+			bound = slice(self.round_bounds[ind], self.round_bounds[ind + 1])
+
+			order = np.argsort(self.ranks[bound])
+			players = self.round_players[bound][order].tolist()
+
+			names = []
+
+			for player, variant in zip(players, variants[bound][order].tolist()):
+				name = self.player_names[player]
+
+				if variant:
+					name = self.aliases.get(player, name.lower())
+
+				names.append(name)
+
+			season = self.season_names[self.round_seasons[ind]]
+
+			with open(f'{folder}/Data/{DATA.season_folder(season)}/{self.round_numbers[ind]}.txt',
+				'w', encoding='utf-8') as f:
+				f.write("\n".join([str(self.day_IDs[self.round_days[ind]])] + names))
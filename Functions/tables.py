@@ -0,0 +1,78 @@
+import numpy as np
+
+class StringTable():
+	"""
+	Dictionary encoding for names: every unique string gets a dense integer ID
+	"""
+
+	def __init__(self, strings=()):
+		self.strings = []
+		self.ids = {}
+
+		for string in strings:
+			self.intern(string)
+
+
+	def __len__(self):
+		return len(self.strings)
+
+
+	def __getitem__(self, string_id):
+		return self.strings[string_id]
+
+
+	def intern(self, string):
+		"""Returns the ID of a string, adding it to the table if it's new"""
+
+		if string not in self.ids:
+			self.ids[string] = len(self.strings)
+			self.strings.append(string)
+
+		return self.ids[string]
+
+
+	def id(self, string):
+		"""Returns the ID of a string, or -1 if it's not in the table"""
+
+		return self.ids.get(string, -1)
+
+
+class MonthTable():
+	"""
+	Read-only, list-like view over a record array sorted by its month field
+
+	Indexing a month decodes only that month's rows back into the JSON
+	data layout, so name-based lookups keep working on the encoded data
+	"""
+
+	def __init__(self, records, month_count, decode):
+		self.records = records
+		self.decode = decode
+
+		# Month m spans records[offsets[m]:offsets[m + 1]]
+		self.offsets = np.searchsorted(records['month'], np.arange(month_count + 1))
+
+
+	def __len__(self):
+		return len(self.offsets) - 1
+
+
+	def __getitem__(self, month):
+		return self.decode(self.rows(month))
+
+
+	def __iter__(self):
+		for month in range(len(self)):
+			yield self[month]
+
+
+	def rows(self, month):
+		"""Returns the raw records of a month"""
+
+		if month < 0:
+			month += len(self)
+
+		if not 0 <= month < len(self):
+			raise IndexError("month index out of range")
+
+		return self.records[self.offsets[month]:self.offsets[month + 1]]
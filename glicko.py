@@ -0,0 +1,102 @@
+"""
+Runs the bot's commands locally, without Discord
+
+	python -m glicko run "gl/top 2020 11 30"
+	python -m glicko run "gl/wins Some Player" --react next next sort
+	python -m glicko run "gl/graph Some Player" --repeat 20 --quiet
+
+Or generates a synthetic dataset to run them on
+
+	python -m glicko generate --players 100000 --seasons 500 --contestants 100
+
+Run from the folder main.py is in, since the data is read from there
+"""
+
+import argparse
+import asyncio
+import os
+
+from Functions.metrics import METRICS
+from Functions.synthetic import SyntheticData
+from Functions.snapshot import SNAPSHOT
+from Functions.dates import DATES
+
+async def run(options):
+	# Only running commands needs discord.py
+	from Functions.harness import Harness
+
+	harness = Harness(folder=options.out, quiet=options.quiet)
+
+	for _ in range(options.repeat):
+		await harness.run(options.command, attachments=options.attach)
+
+		for emoji in options.react:
+			await harness.react(emoji)
+
+	if options.repeat > 1 or options.quiet:
+		print(METRICS.table())
+
+
+def generate(options):
+	for data_folder in [SNAPSHOT.JSON_FOLDER, "Data"]:
+		if os.path.exists(f"{options.folder}/{data_folder}") and not options.force:
+			print(f"There's already a {data_folder} folder: use --force to overwrite it")
+			return
+
+	synthetic = SyntheticData(players=options.players, seasons=options.seasons,
+		rounds=options.rounds, contestants=options.contestants, years=options.years,
+		seed=options.seed)
+
+	synthetic.generate(options.folder)
+
+	if synthetic.end_date != DATES.MAX_DATE:
+		print(f"Set GLICKO_MAX_DATE={synthetic.end_date} for the bot to use all of it")
+
+
+def main():
+	parser = argparse.ArgumentParser(prog="glicko",
+		description="Runs the bot's commands without Discord")
+
+	subparsers = parser.add_subparsers(dest="action", required=True)
+
+	run_parser = subparsers.add_parser("run", help="Run a command")
+	run_parser.add_argument("command",
+		help='The whole message, e.g. "gl/top 2020 11 30"')
+	run_parser.add_argument("--react", nargs="+", default=[], metavar="EMOJI",
+		help="Reactions to click on the paginated message, in order: "
+		+ "prev, next, sort, reverse or the emoji itself")
+	run_parser.add_argument("--attach", nargs="+", default=[], metavar="FILE",
+		help="Files to attach to the message")
+	run_parser.add_argument("--out", default="Harness Output", metavar="FOLDER",
+		help="Where files the command sends are saved")
+	run_parser.add_argument("--repeat", type=int, default=1, metavar="N",
+		help="Run the command N times, then print its latency percentiles")
+	run_parser.add_argument("--quiet", action="store_true",
+		help="Don't print or save the output")
+
+	generate_parser = subparsers.add_parser("generate", help="Generate a synthetic dataset")
+	generate_parser.add_argument("--players", type=int, default=10000)
+	generate_parser.add_argument("--seasons", type=int, default=100)
+	generate_parser.add_argument("--rounds", type=int, default=20,
+		help="Rounds per season")
+	generate_parser.add_argument("--contestants", type=int, default=50,
+		help="Average contestants per round")
+	generate_parser.add_argument("--years", type=int, default=None,
+		help=f"Years of data from {DATES.MIN_DATE} (up to {DATES.MAX_DATE} by default)")
+	generate_parser.add_argument("--seed", type=int, default=0)
+	generate_parser.add_argument("--folder", default=".",
+		help=f"Where the {SNAPSHOT.JSON_FOLDER} and Data folders are written")
+	generate_parser.add_argument("--force", action="store_true",
+		help="Overwrite the data that's already there")
+
+	options = parser.parse_args()
+
+	if options.action == "run":
+		asyncio.run(run(options))
+
+	if options.action == "generate":
+		generate(options)
+
+
+if __name__ == "__main__":
+	main()
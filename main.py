@@ -7,7 +7,18 @@ print(f"Booting up on {datetime.datetime.utcnow()}")
 from discord.ext import commands
 from discord import Game
 
-GLICKO_BOT = commands.Bot(command_prefix = "gl/")
+from Functions.data import DATA
+from Functions.assets import ASSETS
+from Functions.paginator import PAGINATOR
+from Functions.metrics import METRICS
+
+class GlickoBot(commands.Bot):
+	def add_cog(self, cog):
+		# Every command is timed, including ones reloaded with gl/reimport
+		METRICS.instrument(cog)
+		super().add_cog(cog)
+
+GLICKO_BOT = GlickoBot(command_prefix = "gl/")
 
 GLICKO_BOT.remove_command("help")
 
@@ -18,6 +29,13 @@ async def on_ready():
 	await GLICKO_BOT.change_presence(
 	activity=Game(name="gl/help"))
 
+	# Load the datasets in the background, so the bot can already respond
+	# to commands that don't need them (or wait only on the ones they need)
+	GLICKO_BOT.loop.run_in_executor(None, DATA.preload)
+	GLICKO_BOT.loop.run_in_executor(None, ASSETS.preload)
+
+	METRICS.start_logging()
+
 @GLICKO_BOT.event
 async def on_command(ctx):
 	print("Command from", ctx.message.author)
@@ -30,6 +48,11 @@ async def on_command(ctx):
 	
 	print("-->", ctx.message.content, "\n")
 
+@GLICKO_BOT.event
+async def on_raw_reaction_add(payload):
+	# Page flips of every paginated command
+	await PAGINATOR.react(payload)
+
 @GLICKO_BOT.event
 async def on_command_error(ctx, error):
 	if type(error) == commands.errors.CommandNotFound:
@@ -0,0 +1,88 @@
+import numpy as np
+
+from Functions.calc import CALC
+
+def reference_decay_RD(RD, days=1):
+	"""The original day-by-day decay, one value at a time"""
+
+	for _ in range(days):
+		if RD < 50:
+			RD = (29 * RD + 50) / 30
+
+		RD = np.sqrt(RD**2 + CALC.C**2/30)
+		RD = min(175, RD)
+
+	return RD
+
+
+def assert_matches_reference(RDs, days):
+	decayed = CALC.decay_RD(np.asarray(RDs)[:, np.newaxis], np.asarray(days))
+
+	assert decayed.shape == (len(RDs), len(days))
+
+	for i, RD in enumerate(RDs):
+		for j, day_count in enumerate(days):
+			np.testing.assert_allclose(
+				decayed[i, j], reference_decay_RD(RD, day_count), rtol=1e-12, atol=1e-9,
+				err_msg=f"RD {RD} decayed over {day_count} days")
+
+
+def test_matches_reference_over_many_days():
+	# Every step out of the low RD branch, and decay all the way up to the cap
+	days = list(range(0, 61)) + [90, 180, 365, 500, 730, 900, 1000, 1200]
+
+	assert_matches_reference(np.linspace(0, 250, 501), days)
+
+
+def test_RD_at_cap():
+	assert_matches_reference([175, 174.99, 175.01, 250], [0, 1, 2, 30, 1000])
+
+	assert CALC.decay_RD(175, 1) == 175
+	assert CALC.decay_RD(175, 1000) == 175
+
+
+def test_zero_days():
+	RDs = np.array([0, 12.5, 49.99, 50, 100, 175, 250])
+
+	np.testing.assert_array_equal(CALC.decay_RD(RDs, 0), RDs)
+
+
+def test_negative_days():
+	RDs = np.array([0, 12.5, 49.99, 50, 100, 175, 250])
+
+	np.testing.assert_array_equal(CALC.decay_RD(RDs, -5), RDs)
+
+
+def test_repeated_RDs_with_different_days():
+	# The same starting RDs decayed over several day counts at once, as with
+	# a player's RD over every day since their last round
+	RDs = np.repeat([0, 20, 20, 49.5, 60, 175], 8)
+	days = np.tile([0, 1, 2, 3, 10, 44, 45, 400], 6)
+
+	decayed = CALC.decay_RD(RDs, days)
+	reference = [reference_decay_RD(RD, n) for RD, n in zip(RDs, days)]
+
+	np.testing.assert_allclose(decayed, reference, rtol=1e-12, atol=1e-9)
+
+
+def test_scalars_and_broadcasting():
+	decayed = CALC.decay_RD(30, 5)
+
+	assert np.ndim(decayed) == 0
+	np.testing.assert_allclose(decayed, reference_decay_RD(30, 5), rtol=1e-12)
+
+	# One RD over several day counts, and several RDs over one day count
+	np.testing.assert_allclose(CALC.decay_RD(30, [1, 5, 50]),
+		[reference_decay_RD(30, n) for n in [1, 5, 50]], rtol=1e-12)
+	np.testing.assert_allclose(CALC.decay_RD([10, 30, 90], 5),
+		[reference_decay_RD(RD, 5) for RD in [10, 30, 90]], rtol=1e-12)
+
+
+def test_inputs_are_not_modified():
+	RDs = np.array([10.0, 30.0, 90.0])
+	days = np.array([5, 0, 20])
+
+	CALC.decay_RD(RDs, days)
+
+	np.testing.assert_array_equal(RDs, [10.0, 30.0, 90.0])
+	np.testing.assert_array_equal(days, [5, 0, 20])
@@ -0,0 +1,79 @@
+import threading
+import asyncio
+
+from Functions.render import RenderPool
+
+async def idle(pool):
+	while pool.running != 0:
+		await asyncio.sleep(0.01)
+
+
+def test_stopping_a_batch_drops_its_queued_jobs():
+	rendered = []
+	release = threading.Event()
+
+	def render(ind):
+		rendered.append(ind)
+
+		# Job 1 is still rendering when the batch is stopped
+		if ind == 1:
+			release.wait(5)
+
+		return ind
+
+	async def run():
+		pool = RenderPool(workers=1, max_per_user=4, processes=False)
+		batch = pool.render_batch("user", render, [[0], [1], [2], [3]])
+
+		assert await batch.__anext__() == 0
+
+		await batch.aclose()
+
+		# Only the job that was already rendering is still counted
+		assert len(pool) == 1
+		assert len(pool.queues) == 0
+
+		release.set()
+		await idle(pool)
+
+		assert len(pool) == 0
+		assert pool.pending == {}
+
+	asyncio.run(run())
+
+	assert rendered == [0, 1]
+
+
+def test_cancelled_jobs_are_never_dispatched():
+	rendered = []
+	release = threading.Event()
+
+	def render(ind):
+		rendered.append(ind)
+		release.wait(5)
+
+		return ind
+
+	async def run():
+		pool = RenderPool(workers=1, processes=False)
+
+		first = pool.submit("user", render, 0)
+		second = pool.submit("user", render, 1)
+		third = pool.submit("other", render, 2)
+
+		# Cancelled while still queued, e.g. by a command that gave up
+		second.cancel()
+
+		release.set()
+
+		assert await first == 0
+		assert await third == 2
+
+		await idle(pool)
+
+		assert len(pool) == 0
+		assert len(pool.queues) == 0
+
+	asyncio.run(run())
+
+	assert rendered == [0, 2]